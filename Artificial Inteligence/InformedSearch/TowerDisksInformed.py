@@ -0,0 +1,134 @@
+import array
+import mmap
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Uninformed Search'))
+
+from searching_framework.informed_search import astar_search
+from TowerDisks import Hanoi
+
+try:
+    import numpy
+except ImportError:  # bez numpy tabelata se cuva kako surova niza od uint16
+    numpy = None
+
+UNREACHED = 0xFFFF
+
+
+class HanoiPattern:
+    # tabela so rastojanija do celta za podmnozestvo od diskovi (pattern);
+    # apstraktnata sostojba e stolbot na sekoj disk od pattern-ot, zapisan
+    # kako broj vo osnova pegs
+
+    def __init__(self, disks, pegs, goal_pegs, directory):
+        self.disks = sorted(disks)  # od najmal kon najgolem
+        self.pegs = pegs
+        self.powers = [pegs ** i for i in range(len(self.disks))]
+        self.goal = sum(goal_pegs[disk] * power for disk, power in zip(self.disks, self.powers))
+        name = 'hanoi_pdb_%d_%s_%d' % (pegs, '-'.join(map(str, self.disks)), self.goal)
+        self.path = os.path.join(directory, name + ('.npy' if numpy is not None else '.bin'))
+        if not os.path.exists(self.path):
+            self.save(self.build())
+        self.table = self.load()
+
+    def build(self):
+        # BFS nanazad od celta; potezite na Hanoi se reverzibilni
+        pegs, powers, count = self.pegs, self.powers, len(self.disks)
+        table = array.array('H', [UNREACHED]) * (pegs ** count)
+        table[self.goal] = 0
+        layer, distance = [self.goal], 0
+        while layer:
+            distance += 1
+            next_layer = []
+            for index in layer:
+                tops = [None] * pegs
+                for i in range(count - 1, -1, -1):
+                    tops[(index // powers[i]) % pegs] = i
+                for source, disk in enumerate(tops):
+                    if disk is None:
+                        continue
+                    for target, top in enumerate(tops):
+                        if target == source or (top is not None and top < disk):
+                            continue
+                        child = index + (target - source) * powers[disk]
+                        if table[child] == UNREACHED:
+                            table[child] = distance
+                            next_layer.append(child)
+            layer = next_layer
+        return table
+
+    def save(self, table):
+        # se zapisuva vo privremena datoteka vo istiot direktorium pa se preimenuva so
+        # os.replace, za drug proces (ili sledno izvrsuvanje po pad) nikogas da ne
+        # procita napolno zapisana tabela
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path) + '.')
+        try:
+            with os.fdopen(descriptor, 'wb') as f:
+                if numpy is not None:
+                    numpy.save(f, numpy.frombuffer(table, dtype=numpy.uint16))
+                else:
+                    table.tofile(f)
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def load(self):
+        # tabelata se cita so memory mapping, pa ne se vcituva cela vo memorija
+        if numpy is not None:
+            return numpy.load(self.path, mmap_mode='r')
+        with open(self.path, 'rb') as f:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)).cast('H')
+
+    def distance(self, peg_of):
+        return int(self.table[sum(peg_of[disk] * power for disk, power in zip(self.disks, self.powers))])
+
+
+class HanoiPatternDatabase:
+    # disjunktni pattern-i: sekoj poteg pomestuva tocno eden disk, pa zbirot
+    # od rastojanijata na pattern-ite e dopustliva hevristika
+
+    def __init__(self, goal, pattern_size=8, directory=None):
+        self.pegs = len(goal)
+        goal_pegs = {disk: i for i, tower in enumerate(goal) for disk in tower}
+        disks = sorted(goal_pegs, reverse=True)
+        directory = directory or os.path.join(tempfile.gettempdir(), 'hanoi-pdb')
+        self.patterns = [HanoiPattern(disks[i:i + pattern_size], self.pegs, goal_pegs, directory)
+                         for i in range(0, len(disks), pattern_size)]
+
+    def h(self, state):
+        peg_of = {disk: i for i, tower in enumerate(state) for disk in tower}
+        return sum(pattern.distance(peg_of) for pattern in self.patterns)
+
+
+class HanoiInformed(Hanoi):
+
+    def __init__(self, initial, goal, pattern_size=8, directory=None):
+        super().__init__(initial, goal)
+        self.pdb = HanoiPatternDatabase(goal, pattern_size, directory)
+
+    def h(self, node):
+        return self.pdb.h(node.state)
+
+
+if __name__ == "__main__":
+    s = input()
+    initial_towers = tuple([tuple(map(int, x.split(','))) if x != '' else () for x in s.split(';')])
+    s = input()
+    goal_towers = tuple([tuple(map(int, x.split(','))) if x != '' else () for x in s.split(';')])
+    """
+    8,7,6,5,4,3,2,1;;;
+    ;;;8,7,6,5,4,3,2,1
+    """
+
+    hanoi = HanoiInformed(initial_towers, goal_towers)
+    result = astar_search(hanoi)
+
+    p = result.solution()
+    print(f'Number of action {len(p)}')
+    print(p)
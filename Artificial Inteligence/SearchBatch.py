@@ -0,0 +1,101 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Uninformed Search'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'InformedSearch'))
+
+from searching_framework.batch import read_instances, solve_batch, write_jsonl
+from searching_framework.portfolio import ALGORITHMS
+from TowerDisks import Hanoi
+from TowerDisksInformed import HanoiInformed
+from Solitaire import Solitaire
+import SnakeInformed
+import SnakeUninformed
+import SoccerUninformed
+
+# sekoja instanca gi ima istite redovi sto soodvetnata skripta gi cita so input(),
+# a instancite se odeleni so prazen red (ili so --one-per-line: edna instanca po red,
+# redovite odeleni so /), na primer za hanoi:
+#
+# 3,2,1;;
+# ;;3,2,1
+#
+# 5,4,3,2,1;;
+# ;;5,4,3,2,1
+
+
+def towers(line):
+    return tuple([tuple(map(int, x.split(','))) if x != '' else () for x in line.split(';')])
+
+
+def points(lines):
+    # prviot red e brojot na tocki, a potoa sleduvaat tockite
+    count = int(lines[0])
+    return tuple(tuple(map(int, line.split(','))) for line in lines[1:count + 1]), lines[count + 1:]
+
+
+def parse_hanoi(lines):
+    return Hanoi(towers(lines[0]), towers(lines[1]))
+
+
+def parse_hanoi_pdb(lines):
+    return HanoiInformed(towers(lines[0]), towers(lines[1]))
+
+
+def parse_solitaire(lines):
+    size = int(lines[0])
+    pegs, lines = points(lines[1:])
+    obstacles, _ = points(lines)
+    return Solitaire(pegs, size, obstacles)
+
+
+def parse_snake(lines):
+    zeleni_jabolki, _ = points(lines)
+    return SnakeInformed.Snake(((0, 7), ((0, 8), (0, 9)), zeleni_jabolki, 'jug'))
+
+
+def parse_snake_red(lines):
+    zeleni_jabolki, lines = points(lines)
+    crveni_jabolki, _ = points(lines)
+    return SnakeUninformed.Snake(((0, 7), ((0, 8), (0, 9)), zeleni_jabolki, 'jug'), crveni_jabolki)
+
+
+def parse_football(lines):
+    man_pos = tuple(map(int, lines[0].split(',')))
+    ball_pos = tuple(map(int, lines[1].split(',')))
+    oponents = SoccerUninformed.generate_oponents([(3, 3), (5, 4)])
+    if not SoccerUninformed.check_valid_game(man_pos, ball_pos, oponents):
+        raise ValueError('nevalidna igra')
+    return SoccerUninformed.Football((man_pos, ball_pos), oponents, [(7, 2), (7, 3)])
+
+
+# ime -> (funkcija za citanje, podrazbirliv algoritam kako vo skriptata)
+PROBLEMS = {
+    'hanoi': (parse_hanoi, 'breadth_first_graph_search'),
+    'hanoi-pdb': (parse_hanoi_pdb, 'astar_search'),
+    'solitaire': (parse_solitaire, 'breadth_first_graph_search'),
+    'snake': (parse_snake, 'astar_search'),
+    'snake-red': (parse_snake_red, 'breadth_first_graph_search'),
+    'football': (parse_football, 'breadth_first_graph_search'),
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Resavanje na mnogu instanci paralelno, izlez vo JSON Lines')
+    parser.add_argument('problem', choices=sorted(PROBLEMS), help='vid na problemot')
+    parser.add_argument('input', nargs='?', default='-', help='vlezna datoteka (- za stdin)')
+    parser.add_argument('--output', default='-', help='izlezna JSONL datoteka (- za stdout)')
+    parser.add_argument('--algorithm', choices=sorted(ALGORITHMS), help='algoritam za prebaruvanje')
+    parser.add_argument('--workers', type=int, help='broj na procesi (podrazbirlivo brojot na CPU)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='sekundi po instanca')
+    parser.add_argument('--one-per-line', action='store_true', help='edna instanca po red, redovite odeleni so /')
+    args = parser.parse_args()
+
+    parse, algorithm = PROBLEMS[args.problem]
+    source = sys.stdin if args.input == '-' else open(args.input)
+    target = sys.stdout if args.output == '-' else open(args.output, 'w')
+    with source, target:
+        instances = read_instances(source, args.one_per_line)
+        write_jsonl(solve_batch(instances, parse, args.algorithm or algorithm, args.workers, args.timeout), target)
@@ -0,0 +1,66 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Uninformed Search'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'InformedSearch'))
+
+from searching_framework.benchmark import BENCHMARK_ALGORITHMS, run_benchmark, write_benchmark
+from TowerDisks import Hanoi
+from TowerDisksInformed import HanoiInformed
+from Solitaire import Solitaire
+import SnakeInformed
+import SnakeUninformed
+import SoccerUninformed
+
+# kanonski katalog: (ime, tezina, funkcija sto go kreira problemot)
+# zmijata sekogas pocnuva od (0,7) so telo (0,8),(0,9) i nasoka jug, kako vo skriptite
+
+SNAKE_START = (0, 7), ((0, 8), (0, 9))
+
+
+def football(man_pos, ball_pos):
+    oponents = SoccerUninformed.generate_oponents([(3, 3), (5, 4)])
+    return SoccerUninformed.Football((man_pos, ball_pos), oponents, [(7, 2), (7, 3)])
+
+
+CATALOGUE = [
+    ('hanoi-3', 'easy', lambda: Hanoi(((3, 2, 1), (), ()), ((), (), (3, 2, 1)))),
+    ('hanoi-5', 'medium', lambda: Hanoi(((5, 4, 3, 2, 1), (), ()), ((), (), (5, 4, 3, 2, 1)))),
+    ('hanoi-7', 'hard', lambda: Hanoi(((7, 6, 5, 4, 3, 2, 1), (), ()), ((), (), (7, 6, 5, 4, 3, 2, 1)))),
+    ('hanoi-pdb-4-pegs-8', 'hard',
+     lambda: HanoiInformed((tuple(range(8, 0, -1)), (), (), ()), ((), (), (), tuple(range(8, 0, -1))))),
+    ('solitaire-5-easy', 'easy', lambda: Solitaire(((0, 2), (1, 3)), 5, ())),
+    ('solitaire-5-medium', 'medium',
+     lambda: Solitaire(((2, 0), (1, 1), (1, 2), (1, 3), (1, 4)), 5, ((4, 1), (4, 2), (4, 3), (4, 4)))),
+    ('solitaire-7-hard', 'hard',
+     lambda: Solitaire(((4, 2), (2, 2), (4, 4), (5, 1), (1, 4), (4, 1), (1, 6), (0, 4), (3, 1), (0, 0),
+                        (4, 3)), 7, ())),
+    ('snake-easy', 'easy', lambda: SnakeInformed.Snake(SNAKE_START + (((0, 3),), 'jug'))),
+    ('snake-medium', 'medium', lambda: SnakeInformed.Snake(SNAKE_START + (((3, 4), (5, 6)), 'jug'))),
+    ('snake-hard', 'hard', lambda: SnakeInformed.Snake(SNAKE_START + (((2, 2), (4, 7), (6, 1)), 'jug'))),
+    ('snake-red-easy', 'easy', lambda: SnakeUninformed.Snake(SNAKE_START + (((0, 3),), 'jug'), ((0, 5),))),
+    ('snake-red-medium', 'medium',
+     lambda: SnakeUninformed.Snake(SNAKE_START + (((3, 4), (5, 6)), 'jug'), ((2, 2),))),
+    ('snake-red-hard', 'hard',
+     lambda: SnakeUninformed.Snake(SNAKE_START + (((2, 2), (4, 7), (6, 1)), 'jug'), ((3, 3), (5, 5)))),
+    ('football-easy', 'easy', lambda: football((0, 2), (1, 2))),
+    ('football-medium', 'medium', lambda: football((1, 1), (2, 1))),
+    ('football-hard', 'hard', lambda: football((0, 5), (1, 1))),
+]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Merenje na algoritmite za prebaruvanje')
+    parser.add_argument('--output', default='benchmark.json', help='izlezna JSON datoteka')
+    parser.add_argument('--timeout', type=float, default=60.0, help='sekundi po izvrsuvanje')
+    parser.add_argument('--instances', nargs='*', help='samo instancite so ovie iminja')
+    parser.add_argument('--algorithms', nargs='*', default=BENCHMARK_ALGORITHMS, help='iminja na algoritmi')
+    args = parser.parse_args()
+
+    catalogue = [entry for entry in CATALOGUE if not args.instances or entry[0] in args.instances]
+    records = run_benchmark(catalogue, args.algorithms, args.timeout,
+                            lambda r: print(f"{r['instance']:20} {r['algorithm']:32} {r['status']:8} "
+                                            f"{r['wall_time']:.3f}s {r.get('nodes_expanded')}"))
+    write_benchmark(records, args.output)
@@ -0,0 +1,42 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from searching_framework.parallel_search import benchmark_parallel_breadth_first_search
+from Solitaire import Solitaire
+
+if __name__ == "__main__":
+    # ist vlez kako za Solitaire.py, na primer:
+    # 8
+    # 12
+    # 0,0
+    # 0,1
+    # 1,1
+    # 2,1
+    # 3,3
+    # 4,3
+    # 5,5
+    # 3,5
+    # 6,2
+    # 1,6
+    # 2,6
+    # 4,4
+    # 0
+    N = int(input())
+    leng = int(input())
+    points = []
+    for i in range(leng):
+        points.append(tuple((map(int, input().split(",")))))
+    points = tuple(points)
+
+    numi = int(input())
+    obs = []
+    for i in range(numi):
+        obs.append(tuple((map(int, input().split(",")))))
+    obs = tuple(obs)
+
+    solitaire = Solitaire(points, N, obs)
+    print(f'CPU count {os.cpu_count()}')
+    for workers, (seconds, speedup) in benchmark_parallel_breadth_first_search(solitaire).items():
+        print(f'{workers} workers: {seconds:.3f}s (x{speedup:.2f})')
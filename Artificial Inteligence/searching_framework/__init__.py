@@ -0,0 +1,23 @@
+"""
+Заедничка рамка за пребарување што ја користат сите проблеми
+(Hanoi, Solitaire, Snake, Football, ...). Класите Problem и Node,
+помошните редици и алгоритмите за неинформирано и информирано
+пребарување се дефинирани само еднаш, овде.
+"""
+
+from .utils import Problem, Node, NodeStore, BitStateSet, Queue, Stack, FIFOQueue, PriorityQueue
+from .statistics import SearchStats
+from .tracing import Tracer
+from .uninformed_search import tree_search, breadth_first_tree_search, depth_first_tree_search, graph_search, \
+    compact_graph_search, breadth_first_graph_search, depth_first_graph_search, depth_limited_search, \
+    iterative_deepening_search, uniform_cost_search, bidirectional_breadth_first_search
+from .informed_search import Memoized, memoize, memoize_heuristic, best_first_graph_search, \
+    greedy_best_first_graph_search, astar_search, anytime_weighted_astar_search, recursive_best_first_search, \
+    iterative_deepening_astar_search, simplified_memory_bounded_astar_search, beam_search
+from .parallel_search import parallel_breadth_first_search
+from .portfolio import portfolio_search
+from .checkpoint import checkpointed_breadth_first_search, resume
+from .external_search import external_breadth_first_search
+from .benchmark import run_benchmark, write_benchmark
+from .batch import read_instances, solve_batch, write_jsonl
+from .async_search import SearchProgress, async_graph_search, async_best_first_graph_search
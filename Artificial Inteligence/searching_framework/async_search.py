@@ -0,0 +1,151 @@
+import asyncio
+import time
+
+from .uninformed_search import _graph_search_steps, _compact_graph_search_steps
+from .informed_search import _best_first_graph_search_steps
+
+"""
+Асинхроно (asyncio) пребарување
+Верзии на graph_search и best_first_graph_search кои не го блокираат
+event loop-от: на секои every експандирани јазли или на секои interval
+секунди пребарувањето му ја враќа контролата на event loop-от со
+await asyncio.sleep(0), па графички интерфејс (pygame, tkinter) или
+asyncio сервер продолжува да реагира. Пребарувањето се прекинува со
+task.cancel(), при што во функцијата се крева asyncio.CancelledError.
+Напредокот се објавува во SearchProgress, кој се чита со async for.
+"""
+
+
+class SearchProgress:
+    """Асинхрон итератор од настани за напредокот на пребарувањето. Секој
+    настан е речник со клучеви nodes_expanded, frontier, explored и elapsed.
+    Ако читателот заостанува, најстарите настани се отфрлаат, така што
+    пребарувањето никогаш не чека на читателот. Итерацијата завршува кога
+    пребарувањето ќе заврши, ќе биде прекинато или ќе падне."""
+
+    def __init__(self, maxsize=100):
+        """
+        :param maxsize: максимален број на непрочитани настани
+        :type maxsize: int
+        """
+        self.events = asyncio.Queue(maxsize)
+        self.closed = False
+
+    def publish(self, event):
+        """Објави настан; ако редицата е полна, се отфрла најстариот."""
+        if self.events.full():
+            self.events.get_nowait()
+        self.events.put_nowait(event)
+
+    def close(self):
+        """Означи крај на настаните."""
+        if not self.closed:
+            self.closed = True
+            self.publish(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed and self.events.empty():
+            raise StopAsyncIteration
+        event = await self.events.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+async def _drive(steps, progress, every, interval):
+    """Изврши го генераторот steps (види run_steps), враќајќи ја контролата
+    на event loop-от на секои every чекори или interval секунди."""
+    start = last = time.perf_counter()
+    expanded = 0
+    try:
+        while True:
+            try:
+                frontier, explored = next(steps)
+            except StopIteration as stop:
+                return stop.value
+            expanded += 1
+            now = time.perf_counter()
+            if expanded % every and now - last < interval:
+                continue
+            last = now
+            if progress is not None:
+                progress.publish({'nodes_expanded': expanded, 'frontier': frontier,
+                                  'explored': explored, 'elapsed': now - start})
+            await asyncio.sleep(0)
+    finally:
+        steps.close()
+        if progress is not None:
+            progress.close()
+
+
+async def async_graph_search(problem, fringe, stats=None, explored=None, tracer=None, early=False,
+                             compact=False, progress=None, every=1000, interval=0.02):
+    """Асинхрона верзија на graph_search (односно compact_graph_search ако
+    compact е True). Го извршува истиот генератор како синхроната верзија,
+    но на секои every експандирани јазли или interval секунди ја враќа
+    контролата на event loop-от и објавува настан во progress.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param fringe:  празна редица (queue)
+    :type fringe: FIFOQueue or Stack or PriorityQueue
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param explored: празно множество за истражените состојби
+    :type explored: set or BitStateSet
+    :param tracer: опционален запис на извадените јазли (не и со compact)
+    :type tracer: Tracer
+    :param early: дали дупликатите и целта се проверуваат при генерирање
+    :type early: bool
+    :param compact: дали јазлите да се чуваат во NodeStore; редицата тогаш
+                    треба да е без следење на припадност
+    :type compact: bool
+    :param progress: опционален објект во кој се објавува напредокот
+    :type progress: SearchProgress
+    :param every: на колку експандирани јазли се враќа контролата
+    :type every: int
+    :param interval: максимално време во секунди без враќање на контролата
+    :type interval: float
+    :return: Node or None, односно (Node, SearchStats) ако е даден stats
+    :rtype: Node
+    """
+    if compact:
+        if tracer is not None or early:
+            raise ValueError('compact не може да се комбинира со tracer или early')
+        steps = _compact_graph_search_steps(problem, fringe, stats, explored)
+    else:
+        steps = _graph_search_steps(problem, fringe, stats, explored, tracer, early)
+    return await _drive(steps, progress, every, interval)
+
+
+async def async_best_first_graph_search(problem, f, stats=None, explored=None, tracer=None, prune=None,
+                                        progress=None, every=1000, interval=0.02):
+    """Асинхрона верзија на best_first_graph_search. Го извршува истиот
+    генератор како синхроната верзија, но на секои every експандирани
+    јазли или interval секунди ја враќа контролата на event loop-от и
+    објавува настан во progress.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param f: дадена функција за евалуација (проценка)
+    :type f: function
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param explored: празно множество за истражените состојби
+    :type explored: set or BitStateSet
+    :param tracer: опционален запис на извадените јазли
+    :type tracer: Tracer
+    :param prune: опционална функција prune(node) за отфрлање на деца
+    :type prune: function
+    :param progress: опционален објект во кој се објавува напредокот
+    :type progress: SearchProgress
+    :param every: на колку експандирани јазли се враќа контролата
+    :type every: int
+    :param interval: максимално време во секунди без враќање на контролата
+    :type interval: float
+    :return: Node or None, односно (Node, SearchStats) ако е даден stats
+    :rtype: Node
+    """
+    steps = _best_first_graph_search_steps(problem, f, stats, explored, tracer, prune)
+    return await _drive(steps, progress, every, interval)
@@ -0,0 +1,187 @@
+import json
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+from .portfolio import ALGORITHMS, run_algorithm
+
+"""
+Решавање на многу инстанци одеднаш
+Наместо по еден процес за секоја инстанца, инстанците се делат на
+неколку работнички процеси кои живеат до крајот, па трошокот за
+стартување на Python се плаќа само еднаш по работник. Работник кој ја
+надминал дозволеното време за една инстанца се прекинува и се заменува
+со нов. Резултатите се враќаат по редоследот по кој се завршени, а секој
+запис го содржи редниот број на инстанцата.
+"""
+
+
+def read_instances(stream, one_per_line=False, separator='/'):
+    """Прочитај инстанци од текстуален тек. Подразбирливо, инстанцата е
+    блок од редови (истите редови што скриптата ги чита со input()), а
+    блоковите се одделени со празен ред. Ако one_per_line е True, секој
+    ред е една инстанца, а нејзините редови се одделени со separator.
+    Редовите што почнуваат со # се игнорираат.
+    :param stream: отворена текстуална датотека или stdin
+    :type stream: file
+    :param one_per_line: дали секој ред е посебна инстанца
+    :type one_per_line: bool
+    :param separator: одделувач на редовите во рамки на еден ред
+    :type separator: str
+    :return: генератор од листи со редови
+    :rtype: generator
+    """
+    block = []
+    for line in stream:
+        line = line.strip()
+        if line.startswith('#'):
+            continue
+        if one_per_line:
+            if line:
+                yield [part.strip() for part in line.split(separator)]
+        elif line:
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def _record(index, status, **fields):
+    """Запис за инстанца која не стигнала до алгоритамот (грешка при
+    читање, timeout, пад), со истите клучеви како записите од run_algorithm."""
+    record = dict.fromkeys(('solution', 'solution_length', 'path_cost', 'nodes_expanded',
+                            'nodes_generated', 'wall_time'))
+    record.update(fields, index=index, status=status)
+    return record
+
+
+def _worker(connection, parse, algorithm):
+    """Работнички процес: прима (реден број, редови), ги решава и праќа запис."""
+    while True:
+        job = connection.recv()
+        if job is None:
+            break
+        index, lines = job
+        try:
+            problem = parse(lines)
+        except Exception as error:
+            connection.send(_record(index, 'error', error=repr(error)))
+            continue
+        node, record = run_algorithm(algorithm, problem)
+        record.update(index=index, solution=node.solution() if node is not None else None)
+        connection.send(record)
+    connection.close()
+
+
+class _Slot:
+    """Еден работник заедно со инстанцата што моментално ја решава."""
+
+    def __init__(self, parse, algorithm):
+        self.connection, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker, args=(child, parse, algorithm), daemon=True)
+        self.process.start()
+        child.close()
+        self.job = None
+        self.start = None
+
+    def submit(self, job):
+        self.job = job
+        self.start = time.perf_counter()
+        self.connection.send(job)
+
+    def stop(self, terminate=False):
+        if terminate:
+            self.process.terminate()
+        else:
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+        self.process.join()
+        self.connection.close()
+
+
+def solve_batch(instances, parse, algorithm='breadth_first_graph_search', workers=None, timeout=60.0):
+    """Реши ги сите инстанци со workers работнички процеси.
+    :param instances: итерабилна низа од инстанци (на пр. од read_instances);
+                      се чита постепено, па може да биде и бесконечен тек
+    :type instances: iterable
+    :param parse: функција на ниво на модул која од една инстанца го
+                  креира проблемот (Problem); грешка значи статус 'error'
+    :type parse: function
+    :param algorithm: име на алгоритам од portfolio.ALGORITHMS
+    :type algorithm: str
+    :param workers: број на работници (None значи os.cpu_count())
+    :type workers: int
+    :param timeout: максимално време во секунди за една инстанца
+    :type timeout: float
+    :return: генератор од записи (речници) по редот на завршување, со
+             клучевите од portfolio.run_algorithm и index и solution;
+             статусот може да биде и 'timeout' или 'crashed'
+    :rtype: generator
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f'Непознат алгоритам {algorithm}')
+    jobs = enumerate(instances)
+    workers = workers or os.cpu_count() or 1
+    slots = []
+    try:
+        for job in jobs:
+            slot = _Slot(parse, algorithm)
+            slot.submit(job)
+            slots.append(slot)
+            if len(slots) == workers:
+                break
+        while slots:
+            now = time.perf_counter()
+            remaining = min(slot.start + timeout for slot in slots) - now if timeout is not None else None
+            ready = wait([slot.connection for slot in slots], max(remaining, 0) if remaining is not None else None)
+            now = time.perf_counter()
+            for slot in list(slots):
+                if slot.connection in ready:
+                    try:
+                        record = slot.connection.recv()
+                    except EOFError:  # работникот умрел без да прати запис
+                        record = None
+                        status = 'crashed'
+                elif timeout is not None and now - slot.start >= timeout:
+                    record = None
+                    status = 'timeout'
+                else:
+                    continue
+                if record is None:
+                    slot.stop(terminate=True)
+                    record = _record(slot.job[0], status, wall_time=now - slot.start)
+                    slots.remove(slot)
+                    slot = _Slot(parse, algorithm)
+                    slots.append(slot)
+                yield record
+                job = next(jobs, None)
+                if job is None:
+                    slot.stop()
+                    slots.remove(slot)
+                else:
+                    slot.submit(job)
+    finally:
+        for slot in slots:
+            slot.stop(terminate=True)
+
+
+def write_jsonl(records, stream):
+    """Запиши ги записите како JSON Lines, по еден ред за секоја инстанца.
+    :param records: записи од solve_batch
+    :type records: iterable
+    :param stream: отворена текстуална датотека или stdout
+    :type stream: file
+    :return: број на запишани записи
+    :rtype: int
+    """
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, sort_keys=True, default=repr) + '\n')
+        stream.flush()
+        count += 1
+    return count
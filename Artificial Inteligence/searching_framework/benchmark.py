@@ -0,0 +1,95 @@
+import json
+import multiprocessing
+import platform
+import time
+
+try:
+    import resource
+except ImportError:  # на Windows нема resource, па не се мери RSS
+    resource = None
+
+from .portfolio import ALGORITHMS, run_algorithm
+
+"""
+Мерење на брзината на алгоритмите над каталог од проблеми
+Секој пар (инстанца, алгоритам) се извршува во посебен процес, така што
+максималната резидентна меморија (peak RSS) се однесува само на тоа
+извршување, а извршувањето може да се прекине по timeout секунди.
+Резултатите се запишуваат во JSON со подредени клучеви, за да може да се
+споредат (diff) помеѓу две верзии.
+"""
+
+BENCHMARK_ALGORITHMS = ('breadth_first_graph_search', 'depth_first_graph_search',
+                        'iterative_deepening_search', 'uniform_cost_search',
+                        'greedy_best_first_graph_search', 'astar_search',
+                        'recursive_best_first_search')
+
+
+def _measure(name, problem, connection):
+    """Изврши го алгоритамот name над problem и прати го резултатот."""
+    _, record = run_algorithm(name, problem)
+    record['peak_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    connection.send(record)
+    connection.close()
+
+
+def run_benchmark(catalogue, algorithms=BENCHMARK_ALGORITHMS, timeout=60.0, progress=None):
+    """Изврши ги сите применливи алгоритми над секоја инстанца од каталогот.
+    Информираните алгоритми се прескокнуваат ако проблемот нема h.
+    :param catalogue: листа од торки (име на инстанца, тежина, функција
+                      без аргументи која го креира проблемот)
+    :type catalogue: list
+    :param algorithms: имиња на алгоритми од portfolio.ALGORITHMS
+    :type algorithms: tuple(str)
+    :param timeout: максимално време во секунди за едно извршување
+    :type timeout: float
+    :param progress: опционална функција progress(record) која се повикува
+                     по секое извршување
+    :type progress: function
+    :return: листа од записи (речници), по еден за секое извршување
+    :rtype: list
+    """
+    records = []
+    for instance, difficulty, factory in catalogue:
+        problem = factory()
+        for name in algorithms:
+            if ALGORITHMS[name][2] and not hasattr(problem, 'h'):
+                continue
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=_measure, args=(name, problem, sender), daemon=True)
+            start = time.perf_counter()
+            process.start()
+            sender.close()
+            record, status = None, 'timeout'
+            if receiver.poll(timeout):
+                try:
+                    record = receiver.recv()
+                except EOFError:  # процесот паднал (на пр. премногу длабока рекурзија)
+                    status = 'crashed'
+            else:
+                process.terminate()
+            process.join()
+            receiver.close()
+            if record is None:
+                record = {'status': status, 'exitcode': process.exitcode,
+                          'wall_time': time.perf_counter() - start}
+            record.update(instance=instance, difficulty=difficulty, algorithm=name)
+            records.append(record)
+            if progress is not None:
+                progress(record)
+    return records
+
+
+def write_benchmark(records, path):
+    """Запиши ги резултатите заедно со информации за околината во JSON.
+    :param records: записи од run_benchmark
+    :type records: list
+    :param path: патека до излезната датотека
+    :type path: str
+    :return: None
+    """
+    with open(path, 'w') as f:
+        json.dump({'python': platform.python_version(),
+                   'platform': platform.platform(),
+                   'results': records}, f, indent=2, sort_keys=True)
+        f.write('\n')
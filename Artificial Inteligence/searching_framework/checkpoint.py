@@ -0,0 +1,183 @@
+import os
+import pickle
+import struct
+
+from .utils import NodeStore
+
+"""
+Зачувување (checkpoint) и продолжување на долго пребарување во ширина
+Пребарувањето во ширина ги чува јазлите во NodeStore и ги отстранува
+дупликатите уште при генерирање. Така секој јазол во складиштето е и
+истражена состојба, а редицата е секогаш опсегот од id [head, len(store)).
+Checkpoint-от затоа се состои од самото складиште и бројот head.
+
+Форматот во директориумот на checkpoint-от:
+    nodes.bin  - сегменти што само се додаваат на крајот; секој сегмент ги
+                 содржи јазлите додадени од претходното зачувување
+                 (клучеви, и бајтите од низите parents, actions, costs)
+    header.bin - head, број на зачувани јазли и валидна должина на nodes.bin
+
+Бидејќи се запишуваат само новите јазли, едно зачувување трае
+пропорционално на бројот на јазли генерирани од последното зачувување.
+"""
+
+_HEADER = struct.Struct('<qqq')
+
+
+class Checkpoint:
+    """Директориум во кој се зачувува состојбата на пребарувањето."""
+
+    def __init__(self, path):
+        """
+        :param path: патека до директориумот
+        :type path: str
+        """
+        self.path = path
+        self.nodes_path = os.path.join(path, 'nodes.bin')
+        self.header_path = os.path.join(path, 'header.bin')
+        self.saved_nodes = 0
+        self.saved_actions = 0
+        self.size = 0
+
+    def reset(self):
+        """Избриши го претходниот checkpoint во директориумот."""
+        os.makedirs(self.path, exist_ok=True)
+        for name in (self.nodes_path, self.header_path):
+            if os.path.exists(name):
+                os.remove(name)
+        self.saved_nodes = self.saved_actions = self.size = 0
+
+    def save(self, store, head):
+        """Додади ги новите јазли од store во nodes.bin и запиши го head.
+        Заглавието се заменува атомски по запишувањето на сегментот, па
+        прекин во текот на зачувувањето го остава претходниот checkpoint.
+        :param store: складиште на јазли
+        :type store: NodeStore
+        :param head: id на првиот јазол во редицата
+        :type head: int
+        :return: None
+        """
+        start = self.saved_nodes
+        segment = (store.keys[start:],
+                   store.parents[start:].tobytes(),
+                   store.actions[start:].tobytes(),
+                   store.costs[start:].tobytes(),
+                   store.action_list[self.saved_actions:])
+        with open(self.nodes_path, 'ab') as f:
+            f.truncate(self.size)
+            pickle.dump(segment, f, pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+            self.size = f.tell()
+        self.saved_nodes = len(store)
+        self.saved_actions = len(store.action_list)
+        temp = self.header_path + '.tmp'
+        with open(temp, 'wb') as f:
+            f.write(_HEADER.pack(head, self.saved_nodes, self.size))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, self.header_path)
+
+    def load(self, problem):
+        """Прочитај го складиштето и head од директориумот.
+        :param problem: проблемот за кој е зачуван checkpoint-от
+        :type problem: Problem
+        :return: торка (store, head)
+        :rtype: tuple
+        """
+        with open(self.header_path, 'rb') as f:
+            head, count, size = _HEADER.unpack(f.read(_HEADER.size))
+        store = NodeStore(problem)
+        with open(self.nodes_path, 'rb') as f:
+            while f.tell() < size:
+                keys, parents, actions, costs, action_list = pickle.load(f)
+                store.keys.extend(keys)
+                store.parents.frombytes(parents)
+                store.actions.frombytes(actions)
+                store.costs.frombytes(costs)
+                store.action_list.extend(action_list)
+        if len(store) != count:
+            raise ValueError('Оштетен checkpoint: %d наместо %d јазли' % (len(store), count))
+        store.action_ids = {action: i for i, action in enumerate(store.action_list)}
+        self.saved_nodes = count
+        self.saved_actions = len(store.action_list)
+        self.size = size
+        return store, head
+
+
+def checkpointed_breadth_first_search(problem, checkpoint_path, every=10000, stats=None):
+    """Пребарување во ширина кое на секои every експандирани јазли ја
+    зачувува својата состојба во checkpoint_path. Го враќа истото решение
+    како breadth_first_graph_search. Прекинато пребарување се продолжува
+    со resume(checkpoint_path, problem). Проблемот мора да има encode и
+    decode кои се инверзни.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param checkpoint_path: директориум за checkpoint-от
+    :type checkpoint_path: str
+    :param every: на колку експандирани јазли се зачувува
+    :type every: int
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node or None
+    :rtype: Node
+    """
+    checkpoint = Checkpoint(checkpoint_path)
+    checkpoint.reset()
+    store = NodeStore(problem)
+    store.add(problem.initial)
+    checkpoint.save(store, 0)
+    return _search(problem, store, 0, checkpoint, every, stats)
+
+
+def resume(checkpoint_path, problem, every=10000, stats=None):
+    """Продолжи го пребарувањето зачувано во checkpoint_path. Статистиките
+    ја опфаќаат само работата направена по продолжувањето.
+    :param checkpoint_path: директориум со checkpoint
+    :type checkpoint_path: str
+    :param problem: истиот проблем за кој е зачуван checkpoint-от
+    :type problem: Problem
+    :param every: на колку експандирани јазли се зачувува
+    :type every: int
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node or None
+    :rtype: Node
+    """
+    checkpoint = Checkpoint(checkpoint_path)
+    store, head = checkpoint.load(problem)
+    return _search(problem, store, head, checkpoint, every, stats)
+
+
+def _search(problem, store, head, checkpoint, every, stats):
+    if stats is not None:
+        problem = stats.track(problem)
+        store.problem = problem
+    encode = problem.encode
+    explored = set(store.keys)
+    expanded = 0
+    while head < len(store):
+        node_id = head
+        head += 1
+        state = store.state(node_id)
+        if problem.goal_test(state):
+            node = store.node(node_id)
+            return node if stats is None else stats.done(node, explored)
+        cost = store.costs[node_id]
+        children = 0
+        for action, next_state in problem.transitions(state):
+            children += 1
+            key = encode(next_state)
+            if key in explored:
+                if stats is not None:
+                    stats.duplicates_pruned += 1
+                continue
+            explored.add(key)
+            store.add(next_state, node_id, action,
+                      problem.path_cost(cost, state, action, next_state), key)
+        if stats is not None:
+            stats.expanded(children, len(store) - head)
+        expanded += 1
+        if expanded % every == 0:
+            checkpoint.save(store, head)
+    return None if stats is None else stats.done(None, explored)
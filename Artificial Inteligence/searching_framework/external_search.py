@@ -0,0 +1,359 @@
+import bisect
+import heapq
+import itertools
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+from .utils import Node
+
+"""
+Пребарување во ширина со надворешна меморија (external-memory BFS)
+Множеството од истражени состојби не се чува во RAM, туку на диск. Секое
+ниво се генерира во подредени датотеки (runs) од најмногу run_size клучеви,
+кои потоа се спојуваат (merge) и од нив се отстрануваат состојбите веќе
+видени во претходните нивоа (delayed duplicate detection). Следното ниво
+се чита од диск со mmap. Потребно е problem.encode да враќа int или bytes.
+
+Претходните нивоа не се препишуваат во една датотека по секое ниво, туку
+се чуваат како посебни подредени сегменти кои геометриски се спојуваат
+(како кај LSM дрвата): сегментот се спојува со претходниот штом
+претходниот не е барем двапати поголем. Така има O(log) сегменти, а секој
+клуч се препишува O(log) пати наместо по еднаш за секое ниво. За секој
+сегмент во меморија се чува ретък индекс (секој _INDEX_EVERY-ти клуч и
+неговата позиција), па проверката на едно мало ниво не го чита целиот
+сегмент, туку само блоковите во кои би можеле да бидат клучевите.
+
+Секоја датотека е низа од записи <должина (2 бајти)><клуч во бајти>,
+подредени по клучот. Во датотеките на нивоата по секој клуч следи
+клучот на неговиот родител, за да може патот да се реконструира.
+"""
+
+_LENGTH = struct.Struct('<H')
+_INDEX_EVERY = 128
+
+
+def _to_bytes(key):
+    if isinstance(key, int):
+        return key.to_bytes((key.bit_length() + 8) // 8, 'big', signed=True)
+    return key
+
+
+def _write_keys(path, keys, int_keys, index=None):
+    """Запиши ги клучевите (веќе подредени) во датотеката path.
+    :param index: опционален пар листи (клучеви, позиции) во кој се
+                  додава секој _INDEX_EVERY-ти клуч и неговата позиција
+    :type index: tuple(list, list)
+    :return: број на запишани клучеви
+    :rtype: int
+    """
+    count = offset = 0
+    with open(path, 'wb') as f:
+        for key in keys:
+            data = _to_bytes(key) if int_keys else key
+            if index is not None and count % _INDEX_EVERY == 0:
+                index[0].append(key)
+                index[1].append(offset)
+            f.write(_LENGTH.pack(len(data)))
+            f.write(data)
+            offset += _LENGTH.size + len(data)
+            count += 1
+    return count
+
+
+def _key_at(data, offset, int_keys):
+    """Прочитај го клучот на позиција offset.
+    :return: (клуч, позиција на следниот клуч)
+    :rtype: tuple
+    """
+    length, = _LENGTH.unpack_from(data, offset)
+    offset += _LENGTH.size
+    raw = data[offset:offset + length]
+    return int.from_bytes(raw, 'big', signed=True) if int_keys else raw, offset + length
+
+
+def _read_keys(path, int_keys):
+    """Генератор кој ги чита клучевите од датотеката path со mmap."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = 0
+            while offset < size:
+                key, offset = _key_at(data, offset, int_keys)
+                yield key
+
+
+def _write_pairs(path, pairs, int_keys):
+    """Запиши ги паровите (клуч, родител), подредени по клучот, во path.
+    :return: број на запишани парови
+    :rtype: int
+    """
+    return _write_keys(path, itertools.chain.from_iterable(pairs), int_keys) // 2
+
+
+def _read_pairs(path, int_keys):
+    """Генератор од паровите (клуч, родител) од датотеката path."""
+    keys = _read_keys(path, int_keys)
+    return zip(keys, keys)
+
+
+def _layer_keys(path, int_keys):
+    """Генератор само од клучевите (без родителите) од датотеката path."""
+    return itertools.islice(_read_keys(path, int_keys), 0, None, 2)
+
+
+def _unique(pairs):
+    """Отстрани ги паровите со ист клуч како претходниот од подредена низа
+    парови; од дупликатите останува оној со најмал родител."""
+    last = object()
+    for pair in pairs:
+        if pair[0] != last:
+            last = pair[0]
+            yield pair
+
+
+def _difference(pairs, cursors):
+    """Паровите од подредената низа pairs чиј клуч го нема во ниту еден од
+    сегментите (_Cursor)."""
+    for pair in pairs:
+        if not any(cursor.contains(pair[0]) for cursor in cursors):
+            yield pair
+
+
+class _Cursor:
+    """Читач на еден сегмент за клучеви кои се бараат по растечки ред.
+    Со ретките индекси прескокнува до блокот во кој би бил клучот, така
+    што никогаш не чита повеќе од целиот сегмент, ниту повеќе од еден
+    блок по барање."""
+
+    def __init__(self, path, index, int_keys):
+        self.file = open(path, 'rb')
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self.index = index
+        self.int_keys = int_keys
+        self.offset = 0
+
+    def contains(self, key):
+        block = bisect.bisect_right(self.index[0], key) - 1
+        if block >= 0 and self.index[1][block] > self.offset:
+            self.offset = self.index[1][block]
+        while self.offset < self.size:
+            current, following = _key_at(self.data, self.offset, self.int_keys)
+            if current >= key:
+                return current == key
+            self.offset = following
+        return False
+
+    def close(self):
+        if self.size:
+            self.data.close()
+        self.file.close()
+
+
+class _Runs:
+    """Подредени датотеки (runs) од парови (клуч, родител) на едно ниво во
+    директориумот directory."""
+
+    def __init__(self, directory, int_keys, run_size, fan_in):
+        self.directory = directory
+        self.int_keys = int_keys
+        self.run_size = run_size
+        self.fan_in = fan_in
+        self.buffer = []
+        self.paths = []
+        self.counter = 0
+
+    def new_path(self, prefix):
+        self.counter += 1
+        return os.path.join(self.directory, '%s-%d.bin' % (prefix, self.counter))
+
+    def add(self, key, parent):
+        self.buffer.append((key, parent))
+        if len(self.buffer) >= self.run_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.buffer.sort()
+            path = self.new_path('run')
+            _write_pairs(path, _unique(self.buffer), self.int_keys)
+            self.paths.append(path)
+            self.buffer = []
+
+    def merge(self):
+        """Спои ги сите runs во повеќе премини од најмногу fan_in датотеки.
+        :return: подреден генератор од парови без дупликати по клучот
+        """
+        self.flush()
+        while len(self.paths) > self.fan_in:
+            group, self.paths = self.paths[:self.fan_in], self.paths[self.fan_in:]
+            path = self.new_path('run')
+            _write_pairs(path, _unique(heapq.merge(*[_read_pairs(p, self.int_keys) for p in group])),
+                         self.int_keys)
+            for p in group:
+                os.remove(p)
+            self.paths.append(path)
+        return _unique(heapq.merge(*[_read_pairs(p, self.int_keys) for p in self.paths]))
+
+    def remove(self):
+        for path in self.paths:
+            os.remove(path)
+        self.paths = []
+        self.buffer = []
+
+
+class _Segments:
+    """Истражените состојби како подредени сегменти на диск, секој со свој
+    ретки индекс. Секое ново ниво станува сегмент, а последните два
+    сегменти се спојуваат сè додека претходниот не стане повеќе од двапати
+    поголем од последниот. Ако е даден keep, наместо спојување се чуваат
+    само последните keep сегменти."""
+
+    def __init__(self, runs, keep=None):
+        self.runs = runs
+        self.keep = keep
+        self.segments = []
+
+    def write(self, keys):
+        path = self.runs.new_path('visited')
+        index = ([], [])
+        count = _write_keys(path, keys, self.runs.int_keys, index)
+        self.segments.append((path, count, index))
+
+    def add(self, keys):
+        """Додади ги подредените клучеви на едно ниво како нов сегмент."""
+        self.write(keys)
+        if self.keep is not None:
+            while len(self.segments) > self.keep:
+                os.remove(self.segments.pop(0)[0])
+            return
+        while len(self.segments) > 1 and self.segments[-2][1] <= 2 * self.segments[-1][1]:
+            last, previous = self.segments.pop(), self.segments.pop()
+            self.write(heapq.merge(_read_keys(previous[0], self.runs.int_keys),
+                                   _read_keys(last[0], self.runs.int_keys)))
+            os.remove(previous[0])
+            os.remove(last[0])
+
+    def cursors(self):
+        return [_Cursor(path, index, self.runs.int_keys) for path, _, index in self.segments]
+
+
+def external_breadth_first_search(problem, directory=None, run_size=1000000, fan_in=64,
+                                  reversible=False, stats=None):
+    """Пребарување во ширина каде нивоата и множеството од истражени
+    состојби се чуваат на диск, а во меморија има најмногу run_size клучеви.
+    Го враќа решението со најмала длабочина (патот може да се разликува од
+    breadth_first_graph_search, бидејќи секое ниво се обработува подредено
+    по клучот). Патот се реконструира на крајот од клучевите на родителите
+    зачувани во нивоата, со едно барање по чекор.
+    :param problem: даден проблем со encode што враќа int или bytes
+    :type problem: Problem
+    :param directory: директориум за датотеките (None значи привремен
+                      директориум кој се брише на крајот)
+    :type directory: str
+    :param run_size: максимален број на клучеви во меморија за едно run
+    :type run_size: int
+    :param fan_in: максимален број на датотеки што се спојуваат одеднаш
+    :type fan_in: int
+    :param reversible: дали секоја акција има обратна акција; тогаш
+                       дупликатите на новото ниво се бараат само во
+                       последните две нивоа (frontier search)
+    :type reversible: bool
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node or None
+    :rtype: Node
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    encode, decode = problem.encode, problem.decode
+    root = encode(problem.initial)
+    if isinstance(root, int):
+        int_keys = True
+    elif isinstance(root, bytes):
+        int_keys = False
+    else:
+        raise TypeError('external_breadth_first_search бара encode што враќа int или bytes')
+    temporary = directory is None
+    directory = tempfile.mkdtemp(prefix='external-bfs-') if temporary else directory
+    os.makedirs(directory, exist_ok=True)
+    try:
+        runs = _Runs(directory, int_keys, run_size, fan_in)
+        # кај реверзибилните проблеми децата на едно ниво се во претходното,
+        # истото или следното ниво, па доволни се последните две нивоа
+        visited = _Segments(runs, 2 if reversible else None)
+        layers = [runs.new_path('layer')]
+        # коренот е запишан како свој родител; родителот се чита само во
+        # нивоата после првото
+        total = _write_pairs(layers[0], [(root, root)], int_keys)
+        visited.add([root])
+        goal = parent = None
+        while goal is None:
+            generated = 0
+            for key, parent in _read_pairs(layers[-1], int_keys):
+                state = decode(key)
+                if problem.goal_test(state):
+                    goal = key
+                    break
+                children = 0
+                for action, next_state in problem.transitions(state):
+                    runs.add(encode(next_state), key)
+                    children += 1
+                generated += children
+                if stats is not None:
+                    stats.expanded(children, 0)
+            if goal is not None:
+                runs.remove()
+                break
+            candidates = runs.merge()
+            cursors = visited.cursors()
+            layer = runs.new_path('layer')
+            try:
+                new = _write_pairs(layer, _difference(candidates, cursors), int_keys)
+            finally:
+                for cursor in cursors:
+                    cursor.close()
+            runs.remove()
+            if not new:
+                os.remove(layer)
+                break
+            total += new
+            visited.add(_layer_keys(layer, int_keys))
+            layers.append(layer)
+            if stats is not None:
+                stats.duplicates_pruned += generated - new
+                stats.max_frontier = max(stats.max_frontier, new)
+        node = None if goal is None else _reconstruct(problem, layers, goal, parent, int_keys)
+    finally:
+        if temporary:
+            shutil.rmtree(directory, ignore_errors=True)
+    if stats is None:
+        return node
+    stats.explored_size = total
+    return stats.done(node)
+
+
+def _reconstruct(problem, layers, goal, parent, int_keys):
+    """Најди го патот до goal (со родител parent) така што во секое
+    претходно ниво се бара родителот на тековниот клуч. Акцијата се наоѓа
+    со едно експандирање на родителот."""
+    encode, decode = problem.encode, problem.decode
+    keys = [goal]
+    if len(layers) > 1:
+        key = parent
+        for path in reversed(layers[1:-1]):
+            keys.append(key)
+            key = next(parent for child, parent in _read_pairs(path, int_keys) if child == key)
+        keys.append(key)
+    node = Node(decode(keys.pop()))
+    while keys:
+        key = keys.pop()
+        action, state = next((action, state) for action, state in problem.transitions(node.state)
+                             if encode(state) == key)
+        node = Node(state, node, action, problem.path_cost(node.path_cost, node.state, action, state))
+    return node
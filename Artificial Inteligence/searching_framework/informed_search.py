@@ -0,0 +1,680 @@
+import collections
+import heapq
+import itertools
+import time
+from sys import maxsize as infinity
+
+from .utils import Node, PriorityQueue, run_steps
+from .statistics import SearchStats
+
+"""
+Информирано пребарување во рамки на граф
+"""
+
+
+HEURISTIC_CACHE_SIZE = 1000000
+
+
+class Memoized:
+    """Функција со кеш за пресметаните вредности. Клучот за секој повик е
+    key(*args) (подразбирливо самата торка од аргументи). Ако е зададен
+    maxsize, се чуваат најмногу maxsize вредности, а најдавно користената
+    се отстранува (LRU). Бројачите hits, misses и evictions покажуваат колку
+    е ефикасен кешот, а clear() го празни кешот (на пр. помеѓу две
+    пребарувања со иста хевристика)."""
+
+    def __init__(self, fn, key=None, maxsize=None):
+        """
+        :param fn: зададена функција
+        :type fn: function
+        :param key: функција што го дава клучот во кешот за дадени аргументи
+        :type key: function
+        :param maxsize: максимален број на вредности во кешот (None значи
+                        без ограничување)
+        :type maxsize: int
+        """
+        self.fn = fn
+        self.key = key
+        self.maxsize = maxsize
+        self.cache = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, *args):
+        key = args if self.key is None else self.key(*args)
+        cache = self.cache
+        if key in cache:
+            self.hits += 1
+            if self.maxsize is not None:
+                cache.move_to_end(key)
+            return cache[key]
+        self.misses += 1
+        value = cache[key] = self.fn(*args)
+        if self.maxsize is not None and len(cache) > self.maxsize:
+            cache.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        """Испразни го кешот и ресетирај ги бројачите."""
+        self.cache.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """
+        :return: речник со hits, misses, evictions и size
+        :rtype: dict
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self.cache)}
+
+
+def memoize(fn, slot=None, key=None, maxsize=None):
+    """ Запамети ја пресметаната вредност за која била листа од
+    аргументи. Ако е специфициран slot, зачувај го резултатот во
+    тој slot на првиот аргумент. Ако slot е None, зачувај ги
+    резултатите во кеш со клуч key(*args) и најмногу maxsize вредности.
+    :param fn: зададена функција
+    :type fn: function
+    :param slot: име на атрибут во кој се чуваат резултатите од функцијата
+    :type slot: str
+    :param key: функција што го дава клучот во кешот (подразбирливо торката
+                од аргументи)
+    :type key: function
+    :param maxsize: максимален број на вредности во кешот (LRU)
+    :type maxsize: int
+    :return: функција со модификација за зачувување на резултатите
+    :rtype: function or Memoized
+    """
+    if slot:
+        def memoized_fn(obj, *args):
+            if hasattr(obj, slot):
+                return getattr(obj, slot)
+            else:
+                val = fn(obj, *args)
+                setattr(obj, slot, val)
+                return val
+
+        return memoized_fn
+    return Memoized(fn, key, maxsize)
+
+
+def memoize_heuristic(problem, h=None, maxsize=HEURISTIC_CACHE_SIZE):
+    """Мемоизирај ја хевристиката h (или problem.h) според состојбата на
+    јазелот, односно според problem.encode(node.state), наместо според
+    самиот јазол. Така h се пресметува еднаш за секоја состојба, без
+    разлика по колку патишта се стигнува до неа. Резултатот може да се
+    даде како h на astar_search, greedy_best_first_graph_search и
+    recursive_best_first_search, кои тогаш го користат истиот кеш.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика
+    :type h: function
+    :param maxsize: максимален број на состојби во кешот
+    :type maxsize: int
+    :return: мемоизирана хевристика
+    :rtype: Memoized
+    """
+    encode = problem.encode
+    return memoize(h or problem.h, key=lambda node: encode(node.state), maxsize=maxsize)
+
+
+def _heuristic(problem, h, stats):
+    """Хевристиката што ја користат алгоритмите: h ако веќе е мемоизирана,
+    инаку h (или problem.h) мемоизирана по состојба."""
+    if isinstance(h, Memoized):
+        return h
+    if stats is not None:
+        h = h and stats.timed(h, 'time_h')
+    return memoize_heuristic(problem, h)
+
+
+def best_first_graph_search(problem, f, stats=None, explored=None, tracer=None, prune=None):
+    """Пребарувај низ следбениците на даден проблем за да најдеш цел. Користи
+     функција за евалуација за да се одлучи кој е сосед најмногу ветува и
+     потоа да се истражи. Ако до дадена состојба стигнат два пата, употреби
+     го најдобриот пат.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param f: дадена функција за евалуација (проценка)
+    :type f: function
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param explored: празно множество за истражените состојби (None значи
+                     set(); BitStateSet за приближно пребарување)
+    :type explored: set or BitStateSet
+    :param tracer: опционален запис на извадените јазли
+    :type tracer: Tracer
+    :param prune: опционална функција prune(node); децата за кои враќа True
+                  не се додаваат во редицата
+    :type prune: function
+    :return: Node or None, односно (Node, SearchStats) ако е даден stats
+    :rtype: Node
+    """
+    return run_steps(_best_first_graph_search_steps(problem, f, stats, explored, tracer, prune))
+
+
+def _best_first_graph_search_steps(problem, f, stats, explored, tracer, prune):
+    """best_first_graph_search како генератор кој застанува по секое
+    експандирање и враќа (големина на редицата, број на истражени
+    состојби); види run_steps и async_best_first_graph_search."""
+    if stats is not None:
+        problem = stats.track(problem)
+    f = memoize(f, 'f')
+    encode = problem.encode
+    node = Node(problem.initial)
+    if problem.goal_test(node.state):
+        return node if stats is None else stats.done(node)
+    frontier = PriorityQueue(min, f, lambda n: encode(n.state))
+    frontier.append(node)
+    explored = set() if explored is None else explored
+    while frontier:
+        node = frontier.pop()
+        if tracer is not None:
+            tracer.trace(node, len(frontier))
+        if problem.goal_test(node.state):
+            return node if stats is None else stats.done(node, explored)
+        explored.add(encode(node.state))
+        children = node.expand(problem)
+        for child in children:
+            if prune is not None and prune(child):
+                continue
+            if encode(child.state) not in explored and child not in frontier:
+                frontier.append(child)
+            elif child in frontier:
+                incumbent = frontier[child]
+                if f(child) < f(incumbent):
+                    del frontier[incumbent]
+                    frontier.append(child)
+                elif stats is not None:
+                    stats.duplicates_pruned += 1
+            elif stats is not None:
+                stats.duplicates_pruned += 1
+        if stats is not None:
+            stats.expanded(len(children), len(frontier))
+        yield len(frontier), len(explored)
+    return None if stats is None else stats.done(None, explored)
+
+
+def greedy_best_first_graph_search(problem, h=None, stats=None, explored=None):
+    """ Greedy best-first пребарување се остварува ако се специфицира дека f(n) = h(n).
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика (или мемоизирана со memoize_heuristic)
+    :type h: function or Memoized
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param explored: празно множество за истражените состојби
+    :type explored: set or BitStateSet
+    :return: Node or None
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    h = _heuristic(problem, h, stats)
+    return best_first_graph_search(problem, h, stats, explored)
+
+
+def astar_search(problem, h=None, stats=None, explored=None):
+    """ A* пребарување е best-first graph пребарување каде f(n) = g(n) + h(n).
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика (или мемоизирана со memoize_heuristic)
+    :type h: function or Memoized
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param explored: празно множество за истражените состојби
+    :type explored: set or BitStateSet
+    :return: Node or None
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    h = _heuristic(problem, h, stats)
+    return best_first_graph_search(problem, lambda n: n.path_cost + h(n), stats, explored)
+
+
+class _DeadlineExceeded(Exception):
+    pass
+
+
+def anytime_weighted_astar_search(problem, h=None, weights=(5.0, 3.0, 2.0, 1.5, 1.25, 1.0), deadline=None,
+                                  stats=None):
+    """Anytime weighted A* - генератор кој повторно го извршува
+    best_first_graph_search со f(n) = g(n) + w * h(n) за секоја тежина w од
+    weights (од најголемата кон 1). Со допустлива хевристика цената на
+    решението е најмногу w пати поголема од оптималната, па секое решение
+    се враќа заедно со таа граница. Секое следно решение е построго
+    подобро од претходното: откако ќе се најде решение, јазлите со
+    g + h >= цената на најдоброто решение се отфрлаат, па извршување кое
+    не најде ништо значи дека подобро решение со таа тежина нема. Ако
+    генераторот заврши пред deadline, последното вратено решение е
+    оптимално. Ако е зададен deadline, пребарувањето застанува кога ќе
+    истече времето, а последното вратено решение е најдоброто пронајдено.
+    Кешот на хевристиката се користи во сите извршувања.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика (или мемоизирана со memoize_heuristic)
+    :type h: function or Memoized
+    :param weights: опаѓачки тежини на хевристиката
+    :type weights: tuple(float)
+    :param deadline: максимално време во секунди (None значи без ограничување)
+    :type deadline: float
+    :param stats: опционален собирач на статистики; во stats.iterations се
+                  запишуваат тежината, цената и бројот на јазли за секое извршување
+    :type stats: SearchStats
+    :return: генератор од торки (Node, граница на субоптималност)
+    :rtype: generator
+    """
+    run_stats = stats
+    if deadline is not None:
+        end = time.monotonic() + deadline
+        run_stats = stats if stats is not None else SearchStats()
+        callback, every = run_stats.callback, run_stats.every
+        previous = callback, every
+
+        def check(current):
+            # се повикува на секои 100 експандирани јазли
+            if callback is not None and current.nodes_expanded % every == 0:
+                callback(current)
+            if time.monotonic() >= end:
+                raise _DeadlineExceeded()
+
+        run_stats.callback, run_stats.every = check, 100 if every % 100 == 0 else 1
+    if run_stats is not None:
+        problem = run_stats.track(problem)
+    h = _heuristic(problem, h, run_stats)
+    best = None
+    try:
+        for weight in weights:
+            if deadline is not None and time.monotonic() >= end:
+                return
+            if run_stats is not None:
+                expanded, generated = run_stats.nodes_expanded, run_stats.nodes_generated
+            # со допустлива h, јазол со g + h >= цената на најдоброто решение
+            # не може да доведе до построго подобро решение
+            prune = None if best is None else (lambda n, bound=best.path_cost: n.path_cost + h(n) >= bound)
+            try:
+                node = best_first_graph_search(problem, lambda n, w=weight: n.path_cost + w * h(n), run_stats,
+                                               prune=prune)
+            except _DeadlineExceeded:
+                run_stats.done(best)
+                return
+            if run_stats is not None:
+                node = node[0]
+                if stats is not None:
+                    stats.iterations.append({'weight': weight,
+                                             'cost': node.path_cost if node is not None else None,
+                                             'nodes_expanded': stats.nodes_expanded - expanded,
+                                             'nodes_generated': stats.nodes_generated - generated})
+            if node is None:
+                if best is None:
+                    return
+                continue
+            best = node
+            yield best, weight
+    finally:
+        if deadline is not None:
+            run_stats.callback, run_stats.every = previous
+
+
+def recursive_best_first_search(problem, h=None, stats=None):
+    """Recursive best first search - ја ограничува рекурзијата
+    преку следење на f-вредноста на најдобриот алтернативен пат
+    од било кој јазел предок (еден чекор гледање нанапред).
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика (или мемоизирана со memoize_heuristic)
+    :type h: function or Memoized
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node or None
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    h = _heuristic(problem, h, stats)
+
+    def RBFS(problem, node, flimit):
+        if problem.goal_test(node.state):
+            return node, 0  # (втората вредност е неважна)
+        successors = node.expand(problem)
+        if stats is not None:
+            stats.expanded(len(successors), node.depth + len(successors))
+        if len(successors) == 0:
+            return None, infinity
+        for s in successors:
+            s.f = max(s.path_cost + h(s), node.f)
+        while True:
+            # Подреди ги според најниската f вредност
+            successors.sort(key=lambda x: x.f)
+            best = successors[0]
+            if best.f > flimit:
+                return None, best.f
+            if len(successors) > 1:
+                alternative = successors[1].f
+            else:
+                alternative = infinity
+            result, best.f = RBFS(problem, best, min(flimit, alternative))
+            if result is not None:
+                return result, best.f
+
+    node = Node(problem.initial)
+    node.f = h(node)
+    result, bestf = RBFS(problem, node, infinity)
+    return result if stats is None else stats.done(result)
+
+
+def iterative_deepening_astar_search(problem, h=None, max_table_size=1000000, stats=None):
+    """Iterative deepening A* (IDA*) - пребарување во длабочина ограничено
+    со f = g + h, каде границата се зголемува на најмалата f вредност што
+    ја надминала претходната граница. Наместо рекурзија се користи
+    експлицитен стек, децата се ставаат на стекот подредени според f, а
+    табелата на транспозиции (најмала g за секоја состојба во тековната
+    итерација, најмногу max_table_size состојби) спречува повторно
+    експандирање на состојби до кои веќе се стигнало со помала цена.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика (или мемоизирана со memoize_heuristic)
+    :type h: function or Memoized
+    :param max_table_size: максимален број на состојби во табелата
+    :type max_table_size: int
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node or None
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    h = _heuristic(problem, h, stats)
+    encode = problem.encode
+    root = Node(problem.initial)
+    bound = h(root)
+    while True:
+        table = {}
+        next_bound = infinity
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if problem.goal_test(node.state):
+                if stats is not None:
+                    stats.explored_size = len(table)
+                return node if stats is None else stats.done(node)
+            key = encode(node.state)
+            best = table.get(key)
+            if best is not None and best <= node.path_cost:
+                if stats is not None:
+                    stats.duplicates_pruned += 1
+                continue
+            if best is not None or len(table) < max_table_size:
+                table[key] = node.path_cost
+            successors = node.expand(problem)
+            children = []
+            for child in successors:
+                f = child.path_cost + h(child)
+                if f > bound:
+                    next_bound = min(next_bound, f)
+                else:
+                    children.append((f, child))
+            # Децата со најмала f се ставаат последни за прво да се извадат
+            children.sort(key=lambda pair: pair[0], reverse=True)
+            stack.extend(child for _, child in children)
+            if stats is not None:
+                stats.expanded(len(successors), len(stack))
+        if next_bound == infinity:
+            return None if stats is None else stats.done(None)
+        bound = next_bound
+
+
+class _SMAEntry:
+    """Јазол од дрвото на SMA*. Децата во меморија се чуваат во children, а
+    за заборавените деца се памети само нивната f вредност во forgotten
+    (клучот е редниот број на акцијата во problem.transitions)."""
+
+    __slots__ = ('node', 'parent', 'index', 'own', 'f', 'children', 'forgotten', 'expanded',
+                 'serial')
+
+    def __init__(self, node, parent, index, f, serial):
+        self.node = node
+        self.parent = parent
+        self.index = index
+        self.own = self.f = f
+        self.children = {}
+        self.forgotten = {}
+        self.expanded = False
+        self.serial = serial
+
+    def pending(self):
+        """Најмала f вредност на дел од дрвото кој не е во меморија, или None."""
+        if not self.expanded:
+            return self.f
+        if self.forgotten:
+            return min(self.forgotten.values())
+        return None
+
+
+def simplified_memory_bounded_astar_search(problem, h=None, max_nodes=100000, stats=None):
+    """Simplified memory-bounded A* (SMA*) - A* кој во меморија чува најмногу
+    max_nodes јазли. Кога меморијата ќе се наполни, се брише најлошиот лист
+    (најголема f, најплиток), а неговата f вредност се запишува кај родителот
+    (backup). Родителот повторно се експандира (регенерира) кога заборавениот
+    дел ќе стане најперспективен. Враќа оптимално решение ако хевристиката
+    е допустлива и патот до решението има помалку од max_nodes јазли.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика (или мемоизирана со memoize_heuristic)
+    :type h: function or Memoized
+    :param max_nodes: максимален број на јазли во меморија
+    :type max_nodes: int
+    :param stats: опционален собирач на статистики (nodes_forgotten и
+                  nodes_regenerated го даваат бројот на заборавени и
+                  регенерирани јазли)
+    :type stats: SearchStats
+    :return: Node or None
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    h = _heuristic(problem, h, stats)
+    encode = problem.encode
+    serial = itertools.count()
+    root_node = Node(problem.initial)
+    root = _SMAEntry(root_node, None, None, h(root_node), next(serial))
+    # frontier: јазли кои имаат дел надвор од меморија, најмала f, најдлабок
+    frontier = PriorityQueue(min, lambda e: (e.pending(), -e.node.depth, e.serial),
+                             lambda e: e.serial)
+    # leaves: листови кои може да се бришат, најголема f, најплиток
+    leaves = PriorityQueue(min, lambda e: (-e.f, e.node.depth, -e.serial), lambda e: e.serial)
+    frontier.append(root)
+    # најдобрата (со најмала g) копија од секоја состојба во меморија
+    in_memory = {encode(root_node.state): root}
+    size = 1
+
+    def update(entry):
+        del frontier[entry]
+        if entry.pending() is not None:
+            frontier.append(entry)
+        del leaves[entry]
+        if entry is not root and not entry.children:
+            leaves.append(entry)
+
+    def backup(entry):
+        first = True
+        while entry is not None:
+            if entry.expanded:
+                values = [child.f for child in entry.children.values()]
+                values.extend(entry.forgotten.values())
+                f = min(values) if values else infinity
+            else:
+                f = entry.own
+            if not first and f == entry.f:
+                break
+            entry.f = f
+            update(entry)
+            entry, first = entry.parent, False
+
+    def worst_leaf(protected):
+        # најлошиот лист различен од protected, без да се отстрани од leaves
+        skipped, worst = [], None
+        while leaves and worst is None:
+            leaf = leaves.pop()
+            skipped.append(leaf)
+            if leaf is not protected:
+                worst = leaf
+        leaves.extend(skipped)
+        return worst
+
+    def forget(leaf):
+        nonlocal size
+        del frontier[leaf]
+        del leaves[leaf]
+        parent = leaf.parent
+        del parent.children[leaf.index]
+        key = encode(leaf.node.state)
+        if in_memory.get(key) is leaf:
+            del in_memory[key]
+        parent.forgotten[leaf.index] = leaf.f
+        size -= 1
+        if stats is not None:
+            stats.nodes_forgotten += 1
+        backup(parent)
+
+    while frontier:
+        entry = frontier.pop()
+        if entry.pending() >= infinity:
+            break
+        node = entry.node
+        if problem.goal_test(node.state):
+            return node if stats is None else stats.done(node)
+        del leaves[entry]
+        ancestors = set()
+        parent = entry
+        while parent is not None:
+            ancestors.add(encode(parent.node.state))
+            parent = parent.parent
+        candidates = []
+        for i, (action, state) in enumerate(problem.transitions(node.state)):
+            if i in entry.children or (entry.expanded and i not in entry.forgotten):
+                continue
+            key = encode(state)
+            if key in ancestors:
+                continue
+            child = Node(state, node, action, problem.path_cost(node.path_cost, node.state, action, state))
+            # состојба која е во меморија со помала или еднаква цена не се генерира
+            # повторно; ако таа копија се заборави, ќе се регенерира преку својот родител
+            other = in_memory.get(key)
+            if other is not None and other.node.path_cost <= child.path_cost:
+                entry.forgotten.pop(i, None)
+                if stats is not None:
+                    stats.duplicates_pruned += 1
+                continue
+            f = max(entry.own, child.path_cost + h(child))
+            if i in entry.forgotten:
+                f = max(f, entry.forgotten.pop(i))
+                if stats is not None:
+                    stats.nodes_regenerated += 1
+            if child.depth >= max_nodes - 1 and not problem.goal_test(state):
+                f = infinity
+            candidates.append((f, i, child))
+        entry.expanded = True
+        candidates.sort(key=lambda candidate: (candidate[0], candidate[1]))
+        for n, (f, i, child) in enumerate(candidates):
+            if size >= max_nodes:
+                worst = worst_leaf(entry)
+                if worst is None or (n > 0 and worst.f <= f):
+                    entry.forgotten[i] = f
+                    continue
+                forget(worst)
+            new = _SMAEntry(child, entry, i, f, next(serial))
+            entry.children[i] = new
+            in_memory[encode(child.state)] = new
+            size += 1
+            frontier.append(new)
+            leaves.append(new)
+        backup(entry)
+        if stats is not None:
+            stats.expanded(len(candidates), size)
+    return None if stats is None else stats.done(None)
+
+
+def beam_search(problem, h=None, width=100, rank='f', widen=0, stats=None):
+    """Beam search - пребарување по нивоа (длабочина) кое од секое ниво ги
+    задржува само најдобрите width јазли, рангирани според f = g + h или
+    само според h. Меморијата е ограничена на O(width) јазли по ниво, но
+    решението не мора да е оптимално, а може и да не се најде. Целта се
+    проверува кај децата при генерирање, а од целите на исто ниво се враќа
+    најевтината. Ако решение не е најдено, а нешто било отфрлено, се
+    пробува повторно со двојно поширок beam, најмногу widen пати. Кешот на
+    хевристиката се користи во сите обиди.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param h: дадена функција за хевристика (или мемоизирана со memoize_heuristic)
+    :type h: function or Memoized
+    :param width: број на јазли што се задржуваат на секое ниво
+    :type width: int
+    :param rank: 'f' за рангирање според g + h, 'h' само според хевристиката
+    :type rank: str
+    :param widen: колку пати најмногу да се удвои width ако нема решение
+    :type widen: int
+    :param stats: опционален собирач на статистики; во stats.iterations се
+                  запишуваат ширината, цената и бројот на јазли за секој обид
+    :type stats: SearchStats
+    :return: Node or None
+    """
+    if rank not in ('f', 'h'):
+        raise ValueError("rank мора да биде 'f' или 'h'")
+    if stats is not None:
+        problem = stats.track(problem)
+    h = _heuristic(problem, h, stats)
+    f = h if rank == 'h' else (lambda n: n.path_cost + h(n))
+    root = Node(problem.initial)
+    if problem.goal_test(root.state):
+        return root if stats is None else stats.done(root)
+    for attempt in range(widen + 1):
+        if stats is not None:
+            expanded, generated = stats.nodes_expanded, stats.nodes_generated
+        node, pruned = _beam(problem, root, f, width << attempt, stats)
+        if stats is not None:
+            stats.iterations.append({'width': width << attempt,
+                                     'cost': node.path_cost if node is not None else None,
+                                     'nodes_expanded': stats.nodes_expanded - expanded,
+                                     'nodes_generated': stats.nodes_generated - generated})
+        # ако ништо не е отфрлено, пребарувањето било целосно и нема решение
+        if node is not None or not pruned:
+            break
+    return node if stats is None else stats.done(node)
+
+
+def _beam(problem, root, f, width, stats):
+    """Едно извршување на beam search со дадена ширина. Враќа торка од
+    пронајдената цел (или None) и дали некој јазол бил отфрлен."""
+    encode = problem.encode
+    reached = {encode(root.state)}
+    layer = [root]
+    pruned = False
+    while layer:
+        candidates = {}
+        goal = None
+        for node in layer:
+            children = node.expand(problem)
+            for child in children:
+                key = encode(child.state)
+                if key in reached:
+                    if stats is not None:
+                        stats.duplicates_pruned += 1
+                    continue
+                if problem.goal_test(child.state):
+                    if goal is None or child.path_cost < goal.path_cost:
+                        goal = child
+                    continue
+                # од повеќе патишта до иста состојба на истото ниво се чува најдобриот
+                incumbent = candidates.get(key)
+                if incumbent is None or f(child) < f(incumbent):
+                    candidates[key] = child
+            if stats is not None:
+                stats.expanded(len(children), len(candidates))
+        if goal is not None:
+            return goal, pruned
+        if len(candidates) > width:
+            pruned = True
+            layer = heapq.nsmallest(width, candidates.values(), key=f)
+        else:
+            layer = list(candidates.values())
+        reached.update(encode(node.state) for node in layer)
+    return None, pruned
@@ -0,0 +1,133 @@
+import collections
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .utils import NodeStore
+
+"""
+Паралелно пребарување во ширина
+Секое ниво од пребарувањето се дели на делови (chunks) кои се експандираат
+паралелно во процеси од ProcessPoolExecutor. Координаторот ги спојува
+децата по редослед, ги отстранува дупликатите и го гради следното ниво.
+"""
+
+_problem = None
+
+
+def _init_worker(problem):
+    """Помошна функција која го запишува проблемот во секој процес."""
+    global _problem
+    _problem = problem
+
+
+def _expand_chunk(chunk):
+    """Експандирај дел од нивото во процес.
+    :param chunk: листа од парови (состојба, цена на патот)
+    :type chunk: list
+    :return: торка (листа од (индекс на родителот во chunk, акција,
+             состојба, цена на патот, дали е цел), без дупликати во рамки
+             на chunk; време поминато во transitions; време во goal_test)
+    :rtype: tuple
+    """
+    problem = _problem
+    seen = set()
+    children = []
+    time_successor = time_goal_test = 0.0
+    for i, (state, cost) in enumerate(chunk):
+        start = time.perf_counter()
+        transitions = list(problem.transitions(state))
+        time_successor += time.perf_counter() - start
+        for action, next_state in transitions:
+            key = problem.encode(next_state)
+            if key in seen:
+                continue
+            seen.add(key)
+            start = time.perf_counter()
+            is_goal = problem.goal_test(next_state)
+            time_goal_test += time.perf_counter() - start
+            children.append((i, action, next_state,
+                             problem.path_cost(cost, state, action, next_state), is_goal))
+    return children, time_successor, time_goal_test
+
+
+def parallel_breadth_first_search(problem, workers=None, chunk_size=256, stats=None):
+    """Пребарување во ширина по нивоа, каде секое ниво се експандира
+    паралелно во workers процеси. Бидејќи децата се спојуваат по истиот
+    редослед како кај breadth_first_graph_search, се враќа истото решение
+    со најмала длабочина. Проблемот мора да може да се серијализира (pickle).
+    Времињата во stats (time_successor, time_goal_test) се збир од времињата
+    измерени во сите процеси.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param workers: број на процеси (None значи os.cpu_count())
+    :type workers: int
+    :param chunk_size: број на состојби што се праќаат на процес одеднаш
+    :type chunk_size: int
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node or None
+    :rtype: Node
+    """
+    # во процесите се праќа оригиналниот проблем, а времињата се враќаат заедно со децата
+    tracked = problem if stats is None else stats.track(problem)
+    store = NodeStore(problem)
+    root = store.add(problem.initial)
+    if tracked.goal_test(problem.initial):
+        node = store.node(root)
+        return node if stats is None else stats.done(node)
+    explored = {store.keys[root]}
+    layer = [root]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(problem,)) as executor:
+        while layer:
+            chunks = [layer[i:i + chunk_size] for i in range(0, len(layer), chunk_size)]
+            payload = [[(store.state(node_id), store.costs[node_id]) for node_id in chunk]
+                       for chunk in chunks]
+            next_layer = []
+            goal = None
+            for chunk, (children, time_successor, time_goal_test) in zip(chunks,
+                                                                          executor.map(_expand_chunk, payload)):
+                for i, action, state, cost, is_goal in children:
+                    key = problem.encode(state)
+                    if key in explored:
+                        if stats is not None:
+                            stats.duplicates_pruned += 1
+                        continue
+                    explored.add(key)
+                    node_id = store.add(state, chunk[i], action, cost, key=key)
+                    next_layer.append(node_id)
+                    if is_goal and goal is None:
+                        goal = node_id
+                if stats is not None:
+                    stats.time_successor += time_successor
+                    stats.time_goal_test += time_goal_test
+                    generated = collections.Counter(child[0] for child in children)
+                    for i in range(len(chunk)):
+                        stats.expanded(generated[i], len(next_layer))
+            if goal is not None:
+                node = store.node(goal)
+                return node if stats is None else stats.done(node, explored)
+            layer = next_layer
+    return None if stats is None else stats.done(None, explored)
+
+
+def benchmark_parallel_breadth_first_search(problem, workers=(1, 2, 4, 8), chunk_size=256):
+    """Измери го времето на parallel_breadth_first_search за секој број
+    на процеси во workers.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param workers: броеви на процеси што се мерат
+    :type workers: tuple(int)
+    :param chunk_size: број на состојби што се праќаат на процес одеднаш
+    :type chunk_size: int
+    :return: речник {број на процеси : (време во секунди, забрзување)}
+    :rtype: dict
+    """
+    times = {}
+    for count in workers:
+        start = time.perf_counter()
+        parallel_breadth_first_search(problem, count, chunk_size)
+        times[count] = time.perf_counter() - start
+    base = times[workers[0]]
+    return {count: (seconds, base / seconds) for count, seconds in times.items()}
+
@@ -0,0 +1,165 @@
+import multiprocessing
+import queue
+import time
+
+from .utils import Node
+from .statistics import SearchStats
+from .uninformed_search import breadth_first_graph_search, depth_first_graph_search, \
+    iterative_deepening_search, uniform_cost_search
+from .informed_search import greedy_best_first_graph_search, astar_search, recursive_best_first_search
+
+"""
+Портфолио од алгоритми
+Неколку алгоритми се стартуваат истовремено, секој во свој процес, над
+истиот проблем. Се враќа првото пронајдено решение (или првото решение од
+оптимален алгоритам), а останатите процеси се прекинуваат. За секој
+алгоритам се враќаат статистиките собрани до моментот на прекинување.
+"""
+
+# име : (функција, дали решението е оптимално, дали бара хевристика)
+# BFS и IDS се оптимални по длабочина, т.е. кога сите акции имаат иста цена,
+# а A* е оптимален кога хевристиката е допустлива.
+ALGORITHMS = {
+    'depth_first_graph_search': (depth_first_graph_search, False, False),
+    'breadth_first_graph_search': (breadth_first_graph_search, True, False),
+    'iterative_deepening_search': (iterative_deepening_search, True, False),
+    'uniform_cost_search': (uniform_cost_search, True, False),
+    'greedy_best_first_graph_search': (greedy_best_first_graph_search, False, True),
+    'astar_search': (astar_search, True, True),
+    'recursive_best_first_search': (recursive_best_first_search, True, True),
+}
+
+# на колку секунди се проверува дали некој процес паднал
+POLL_INTERVAL = 0.1
+
+DEFAULT_PORTFOLIO = ('depth_first_graph_search', 'breadth_first_graph_search',
+                     'iterative_deepening_search', 'greedy_best_first_graph_search',
+                     'astar_search')
+
+
+def run_algorithm(name, problem, stats=None):
+    """Изврши го алгоритамот name над problem и опиши го исходот. Ова е
+    заедничкиот дел од портфолиото, мерењето (benchmark) и решавањето на
+    многу инстанци (batch).
+    :param name: име на алгоритам од ALGORITHMS
+    :type name: str
+    :param problem: даден проблем
+    :type problem: Problem
+    :param stats: собирач на статистики (None значи нов SearchStats)
+    :type stats: SearchStats
+    :return: торка (Node или None, запис), каде записот е речник со
+             status ('solved', 'failed' или 'error'), error (само при
+             грешка), solution_length, path_cost, nodes_expanded,
+             nodes_generated и wall_time
+    :rtype: tuple
+    """
+    stats = SearchStats() if stats is None else stats
+    node = None
+    start = time.perf_counter()
+    try:
+        node, stats = ALGORITHMS[name][0](problem, stats=stats)
+        record = {'status': 'solved' if isinstance(node, Node) else 'failed'}
+    except Exception as error:
+        record = {'status': 'error', 'error': repr(error)}
+    record.update(solution_length=len(node.solution()) if node is not None else None,
+                  path_cost=node.path_cost if node is not None else None,
+                  nodes_expanded=stats.nodes_expanded, nodes_generated=stats.nodes_generated,
+                  wall_time=time.perf_counter() - start)
+    return node, record
+
+
+def _run_algorithm(name, problem, results, report_every):
+    """Изврши еден алгоритам во посебен процес. Делумните статистики се
+    праќаат на секои report_every експандирани јазли, а на крај се праќа
+    патот до решението како листа од (акција, состојба), наместо цел Node,
+    за да не се серијализира долгиот синџир од родители.
+    """
+    stats = SearchStats(lambda s: results.put(('progress', name, s.as_dict())), report_every)
+    node, record = run_algorithm(name, problem, stats)
+    if record['status'] == 'error':
+        results.put(('error', name, record['error'], stats.as_dict()))
+        return
+    path = [(n.action, n.state) for n in node.path()] if node is not None else None
+    results.put(('done', name, path, stats.as_dict()))
+
+
+def _rebuild(problem, path):
+    """Изгради го синџирот од јазли од листа од (акција, состојба)."""
+    node = Node(path[0][1])
+    for action, state in path[1:]:
+        node = Node(state, node, action,
+                    problem.path_cost(node.path_cost, node.state, action, state))
+    return node
+
+
+def portfolio_search(problem, algorithms=DEFAULT_PORTFOLIO, optimal=False, timeout=None,
+                     report_every=1000):
+    """Стартувај ги алгоритмите од algorithms паралелно над истиот проблем
+    и врати го првото решение. Ако optimal е True, се прифаќа само решение
+    од оптимален алгоритам (BFS, IDS, UCS или A*). Информираните алгоритми
+    се прескокнуваат ако проблемот нема хевристика h.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param algorithms: имиња на алгоритми од ALGORITHMS
+    :type algorithms: tuple(str)
+    :param optimal: дали се чека на решение од оптимален алгоритам
+    :type optimal: bool
+    :param timeout: максимално време во секунди (None значи без ограничување)
+    :type timeout: float
+    :param report_every: на колку експандирани јазли процесите праќаат
+                         делумни статистики
+    :type report_every: int
+    :return: торка (Node или None, име на алгоритмот кој победил или None,
+             речник {име : статистики}); статусот е running, done, failed,
+             error, crashed (процесот паднал) или terminated
+    :rtype: tuple
+    """
+    names = [name for name in algorithms
+             if not ALGORITHMS[name][2] or hasattr(problem, 'h')]
+    results = multiprocessing.Queue()
+    processes = {name: multiprocessing.Process(target=_run_algorithm,
+                                               args=(name, problem, results, report_every),
+                                               daemon=True)
+                 for name in names}
+    report = {name: {'status': 'running'} for name in names}
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for process in processes.values():
+        process.start()
+    node, winner = None, None
+    pending = set(names)
+    try:
+        while pending and winner is None:
+            wait = POLL_INTERVAL if deadline is None else min(POLL_INTERVAL, deadline - time.monotonic())
+            if wait <= 0:
+                break
+            try:
+                message = results.get(timeout=wait)
+            except queue.Empty:
+                # процес кој завршил без да прати порака паднал (SIGKILL, OOM, segfault);
+                # пораката од процес кој уредно завршил веќе е во редицата
+                dead = [name for name in pending if not processes[name].is_alive()]
+                if dead and results.empty():
+                    for name in dead:
+                        pending.discard(name)
+                        report[name].update(status='crashed', exitcode=processes[name].exitcode)
+                continue
+            kind, name = message[0], message[1]
+            if kind == 'progress':
+                report[name].update(message[2])
+                continue
+            pending.discard(name)
+            if kind == 'error':
+                report[name].update(message[3], status='error', error=message[2])
+                continue
+            report[name].update(message[3], status='done' if message[2] else 'failed')
+            if message[2] is not None and (not optimal or ALGORITHMS[name][1]):
+                node, winner = _rebuild(problem, message[2]), name
+    finally:
+        for name, process in processes.items():
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            if name in pending:
+                report[name]['status'] = 'terminated'
+        results.close()
+    return node, winner, report
@@ -0,0 +1,169 @@
+import time
+
+from .utils import Node
+
+"""
+Собирање на статистики за текот на пребарувањето.
+Секој алгоритам прима опционален параметар stats. Ако stats е None,
+алгоритмот работи како порано и враќа само Node. Ако е даден SearchStats,
+алгоритмот ги полни бројачите и враќа торка (Node, SearchStats).
+"""
+
+
+class SearchStats:
+    """Бројачи за еден повик на алгоритам за пребарување."""
+
+    def __init__(self, callback=None, every=1000):
+        """
+        :param callback: опционална функција callback(stats) која се повикува
+                         на секои every експандирани јазли (на пр. за
+                         праќање на делумни статистики од друг процес)
+        :type callback: function
+        :param every: на колку експандирани јазли се повикува callback
+        :type every: int
+        """
+        self.callback = callback
+        self.every = every
+        self.nodes_generated = 0
+        self.nodes_expanded = 0
+        self.duplicates_pruned = 0
+        self.nodes_forgotten = 0
+        self.nodes_regenerated = 0
+        self.max_frontier = 0
+        self.explored_size = 0
+        self.false_positive_rate = None
+        self.solution_depth = None
+        self.solution_cost = None
+        self.time_successor = 0.0
+        self.time_h = 0.0
+        self.time_goal_test = 0.0
+        self.time_total = 0.0
+        self.iterations = []
+        self._started = None
+
+    def track(self, problem):
+        """Врати го проблемот обвиткан така што се мери времето поминато во
+        successor (transitions, actions, result), h и goal_test. Ако проблемот веќе е
+        обвиткан од овој собирач, се враќа истиот.
+        :param problem: даден проблем
+        :type problem: Problem
+        :return: обвиткан проблем
+        :rtype: TrackedProblem
+        """
+        if self._started is None:
+            self._started = time.perf_counter()
+        if isinstance(problem, TrackedProblem) and problem.stats is self:
+            return problem
+        return TrackedProblem(problem, self)
+
+    def timed(self, fn, counter):
+        """Обвиткај ја функцијата fn така што времето на секој повик се
+        додава на бројачот counter (на пр. 'time_h').
+        :param fn: зададена функција
+        :type fn: function
+        :param counter: име на бројачот
+        :type counter: str
+        :return: обвиткана функција
+        :rtype: function
+        """
+
+        def timed_fn(*args):
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                setattr(self, counter, getattr(self, counter) + time.perf_counter() - start)
+
+        return timed_fn
+
+    def expanded(self, children, frontier_size):
+        """Запиши дека е експандиран еден јазол.
+        :param children: број на генерирани деца
+        :type children: int
+        :param frontier_size: моментална големина на редицата
+        :type frontier_size: int
+        :return: None
+        """
+        self.nodes_expanded += 1
+        self.nodes_generated += children
+        if frontier_size > self.max_frontier:
+            self.max_frontier = frontier_size
+        if self.callback is not None and self.nodes_expanded % self.every == 0:
+            self.callback(self)
+
+    def done(self, node, explored=None):
+        """Заврши го мерењето и врати го резултатот на алгоритмот.
+        :param node: пронајден јазол или None
+        :type node: Node
+        :param explored: множество од истражени состојби (ако постои)
+        :type explored: set or BitStateSet
+        :return: торка (node, stats)
+        :rtype: tuple
+        """
+        if self._started is not None:
+            self.time_total += time.perf_counter() - self._started
+            self._started = None
+        if explored is not None:
+            self.explored_size = len(explored)
+            self.false_positive_rate = getattr(explored, 'false_positive_rate', None)
+        if isinstance(node, Node):
+            self.solution_depth = node.depth
+            self.solution_cost = node.path_cost
+        return node, self
+
+    @property
+    def effective_branching_factor(self):
+        """Ефективен фактор на разгранување b*, т.ш.
+        N + 1 = 1 + b* + (b*)^2 + ... + (b*)^d, каде N е бројот на генерирани
+        јазли, а d е длабочината на решението.
+        :return: b* или None ако нема решение
+        :rtype: float
+        """
+        depth = self.solution_depth
+        if not depth:
+            return None
+        total = self.nodes_generated + 1
+
+        def nodes(b):
+            return sum(b ** i for i in range(depth + 1))
+
+        low, high = 1.0, total ** (1.0 / depth) + 1
+        for _ in range(100):
+            mid = (low + high) / 2
+            if nodes(mid) < total:
+                low = mid
+            else:
+                high = mid
+        return (low + high) / 2
+
+    def as_dict(self):
+        """Врати ги бројачите како речник (на пр. за запишување во JSON).
+        :return: речник од бројачи
+        :rtype: dict
+        """
+        result = {key: value for key, value in vars(self).items()
+                  if not key.startswith('_') and key not in ('callback', 'every')}
+        result['effective_branching_factor'] = self.effective_branching_factor
+        return result
+
+    def __repr__(self):
+        return "<SearchStats %s>" % ', '.join('%s=%s' % item for item in self.as_dict().items())
+
+
+class TrackedProblem:
+    """Проблем кој ги пренесува сите повици до оригиналниот проблем, а го
+    мери времето на successor, transitions, actions, result, h и goal_test."""
+
+    def __init__(self, problem, stats):
+        self.problem = problem
+        self.stats = stats
+        self.successor = stats.timed(problem.successor, 'time_successor')
+        self.transitions = stats.timed(problem.transitions, 'time_successor')
+        self.actions = stats.timed(problem.actions, 'time_successor')
+        self.result = stats.timed(problem.result, 'time_successor')
+        self.goal_test = stats.timed(problem.goal_test, 'time_goal_test')
+        if hasattr(problem, 'h'):
+            self.h = stats.timed(problem.h, 'time_h')
+
+    def __getattr__(self, name):
+        return getattr(self.problem, name)
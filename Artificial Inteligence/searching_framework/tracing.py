@@ -0,0 +1,84 @@
+import json
+
+"""
+Следење (tracing) на текот на пребарувањето
+Алгоритмите примаат опционален параметар tracer. Ако tracer е None
+(подразбирливо), не се запишува ништо. Tracer(every=1) го запишува секој
+изваден јазол, а Tracer(every=N) секој N-ти. Записите се чуваат во бафер
+и се запишуваат одеднаш, како JSON Lines во датотека или преку callback.
+На крајот баферот се празни со close(), или со with Tracer(...) as tracer.
+"""
+
+
+class Tracer:
+    """Бафериран запис на извадените јазли во JSON Lines формат. Секој
+    запис ги содржи редниот број на јазелот, длабочината, g (цена на
+    патот), f (ако е пресметана) и големината на редицата."""
+
+    def __init__(self, output=None, every=1, callback=None, buffer_size=1024, states=False):
+        """
+        :param output: патека до датотека или отворена текстуална датотека
+        :type output: str or file
+        :param every: се запишува секој every-ти јазол (1 значи сите)
+        :type every: int
+        :param callback: функција callback(records) која ја добива листата од
+                         записи (речници) при секое празнење на баферот
+        :type callback: function
+        :param buffer_size: број на записи по кој се празни баферот
+        :type buffer_size: int
+        :param states: дали во записот да се додаде и repr(node.state)
+        :type states: bool
+        """
+        if output is None and callback is None:
+            raise ValueError('Tracer бара output или callback')
+        self.owns_file = isinstance(output, str)
+        self.file = open(output, 'w') if self.owns_file else output
+        self.every = every
+        self.callback = callback
+        self.buffer_size = buffer_size
+        self.states = states
+        self.buffer = []
+        self.count = 0
+
+    def trace(self, node, frontier_size):
+        """Запиши го јазелот node, ако е на ред според every.
+        :param node: извадениот јазол
+        :type node: Node
+        :param frontier_size: моментална големина на редицата
+        :type frontier_size: int
+        :return: None
+        """
+        self.count += 1
+        if self.count % self.every:
+            return
+        record = {'n': self.count, 'depth': node.depth, 'g': node.path_cost,
+                  'f': getattr(node, 'f', None), 'frontier': frontier_size}
+        if self.states:
+            record['state'] = repr(node.state)
+        self.buffer.append(record)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Испразни го баферот во датотеката, односно во callback."""
+        if not self.buffer:
+            return
+        if self.file is not None:
+            self.file.write(''.join(json.dumps(record) + '\n' for record in self.buffer))
+        if self.callback is not None:
+            self.callback(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        """Испразни го баферот и затвори ја датотеката ако ја отворил Tracer."""
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+        elif self.file is not None:
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,495 @@
+import sys
+
+from .utils import Node, NodeStore, Stack, FIFOQueue, PriorityQueue, run_steps
+from .checkpoint import checkpointed_breadth_first_search
+
+"""
+Неинформирано пребарување во рамки на дрво.
+Во рамки на дрвото не разрешуваме јамки.
+"""
+
+
+def tree_search(problem, fringe, stats=None, tracer=None):
+    """ Пребарувај низ следбениците на даден проблем за да најдеш цел.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param fringe:  празна редица (queue)
+    :type fringe: FIFOQueue or Stack or PriorityQueue
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param tracer: опционален запис на извадените јазли
+    :type tracer: Tracer
+    :return: Node or None, односно (Node, SearchStats) ако е даден stats
+    :rtype: Node
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    fringe.append(Node(problem.initial))
+    while fringe:
+        node = fringe.pop()
+        if tracer is not None:
+            tracer.trace(node, len(fringe))
+        if problem.goal_test(node.state):
+            return node if stats is None else stats.done(node)
+        children = node.expand(problem)
+        fringe.extend(children)
+        if stats is not None:
+            stats.expanded(len(children), len(fringe))
+    return None if stats is None else stats.done(None)
+
+
+def breadth_first_tree_search(problem, stats=None, tracer=None):
+    """Експандирај го прво најплиткиот јазол во пребарувачкото дрво.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param tracer: опционален запис на извадените јазли
+    :type tracer: Tracer
+    :return: Node or None
+    :rtype: Node
+    """
+    return tree_search(problem, FIFOQueue(), stats, tracer)
+
+
+def depth_first_tree_search(problem, stats=None, tracer=None):
+    """Експандирај го прво најдлабокиот јазол во пребарувачкото дрво.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param tracer: опционален запис на извадените јазли
+    :type tracer: Tracer
+    :return: Node or None
+    :rtype: Node
+    """
+    return tree_search(problem, Stack(), stats, tracer)
+
+
+"""
+Неинформирано пребарување во рамки на граф
+Основната разлика е во тоа што овде не дозволуваме јамки, 
+т.е. повторување на состојби
+"""
+
+
+def graph_search(problem, fringe, stats=None, explored=None, tracer=None, early=False):
+    """Пребарувај низ следбениците на даден проблем за да најдеш цел.
+     Ако до дадена состојба стигнат два пата, употреби го најдобриот пат.
+     Ако early е True, дупликатите се отстрануваат уште при генерирање
+     (се проверува и редицата и истражените состојби), а целта се
+     проверува кај децата веднаш штом се генерираат. Кај FIFO редица
+     (BFS) решението и понатаму е со најмала длабочина, но редицата не
+     содржи копии од иста состојба и не се експандира уште едно ниво.
+     Овој режим не е за PriorityQueue (UCS), бидејќи не го задржува
+     најевтиниот пат, па тогаш се крева ValueError.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param fringe:  празна редица (queue)
+    :type fringe: FIFOQueue or Stack or PriorityQueue
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param explored: празно множество за истражените состојби (None значи
+                     set(); BitStateSet за приближно пребарување)
+    :type explored: set or BitStateSet
+    :param tracer: опционален запис на извадените јазли
+    :type tracer: Tracer
+    :param early: дали дупликатите и целта се проверуваат при генерирање
+    :type early: bool
+    :return: Node or None, односно (Node, SearchStats) ако е даден stats
+    :rtype: Node
+    """
+    return run_steps(_graph_search_steps(problem, fringe, stats, explored, tracer, early))
+
+
+def _graph_search_steps(problem, fringe, stats, explored, tracer, early):
+    """graph_search како генератор кој застанува по секое експандирање и
+    враќа (големина на редицата, број на истражени состојби). Резултатот
+    е вредноста на StopIteration; види run_steps и async_graph_search."""
+    if early and isinstance(fringe, PriorityQueue):
+        raise ValueError('early не може да се користи со PriorityQueue')
+    if stats is not None:
+        problem = stats.track(problem)
+    encode = problem.encode
+    closed = set() if explored is None else explored
+    if early:
+        return (yield from _early_graph_search_steps(problem, fringe, stats, closed, tracer))
+    fringe.append(Node(problem.initial))
+    while fringe:
+        node = fringe.pop()
+        if tracer is not None:
+            tracer.trace(node, len(fringe))
+        if problem.goal_test(node.state):
+            return node if stats is None else stats.done(node, closed)
+        key = encode(node.state)
+        if key not in closed:
+            closed.add(key)
+            children = node.expand(problem)
+            fringe.extend(children)
+            if stats is not None:
+                stats.expanded(len(children), len(fringe))
+            yield len(fringe), len(closed)
+        elif stats is not None:
+            stats.duplicates_pruned += 1
+    return None if stats is None else stats.done(None, closed)
+
+
+def _early_graph_search_steps(problem, fringe, stats, reached, tracer):
+    # reached ги содржи клучевите на сите состојби што биле ставени во
+    # редицата, т.е. и истражените и оние што сè уште се во редицата
+    encode = problem.encode
+    node = Node(problem.initial)
+    if problem.goal_test(node.state):
+        return node if stats is None else stats.done(node, reached)
+    reached.add(encode(node.state))
+    fringe.append(node)
+    while fringe:
+        node = fringe.pop()
+        if tracer is not None:
+            tracer.trace(node, len(fringe))
+        children = node.expand(problem)
+        for child in children:
+            key = encode(child.state)
+            if key in reached:
+                if stats is not None:
+                    stats.duplicates_pruned += 1
+                continue
+            if problem.goal_test(child.state):
+                return child if stats is None else stats.done(child, reached)
+            reached.add(key)
+            fringe.append(child)
+        if stats is not None:
+            stats.expanded(len(children), len(fringe))
+        yield len(fringe), len(reached)
+    return None if stats is None else stats.done(None, reached)
+
+
+def compact_graph_search(problem, fringe, stats=None, explored=None):
+    """Исто како graph_search, но јазлите се чуваат во NodeStore, па
+    редицата содржи само цели броеви (id на јазли), а множеството closed
+    само клучеви од problem.encode. Објекти Node се градат само за патот
+    до целта, на крајот од пребарувањето.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param fringe:  празна редица (queue) без следење на припадност
+    :type fringe: FIFOQueue or Stack
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param explored: празно множество за истражените состојби
+    :type explored: set or BitStateSet
+    :return: Node or None
+    :rtype: Node
+    """
+    return run_steps(_compact_graph_search_steps(problem, fringe, stats, explored))
+
+
+def _compact_graph_search_steps(problem, fringe, stats, explored):
+    """compact_graph_search како генератор, исто како _graph_search_steps."""
+    if stats is not None:
+        problem = stats.track(problem)
+    store = NodeStore(problem)
+    closed = set() if explored is None else explored
+    fringe.append(store.add(problem.initial))
+    while fringe:
+        node_id = fringe.pop()
+        state = store.state(node_id)
+        if problem.goal_test(state):
+            node = store.node(node_id)
+            return node if stats is None else stats.done(node, closed)
+        key = store.keys[node_id]
+        if key not in closed:
+            closed.add(key)
+            cost = store.costs[node_id]
+            children = 0
+            for action, next_state in problem.transitions(state):
+                children += 1
+                # децата со веќе истражена состојба не се ни зачувуваат
+                child_key = problem.encode(next_state)
+                if child_key in closed:
+                    if stats is not None:
+                        stats.duplicates_pruned += 1
+                    continue
+                fringe.append(store.add(next_state, node_id, action,
+                                        problem.path_cost(cost, state, action, next_state), key=child_key))
+            if stats is not None:
+                stats.expanded(children, len(fringe))
+            yield len(fringe), len(closed)
+        elif stats is not None:
+            stats.duplicates_pruned += 1
+    return None if stats is None else stats.done(None, closed)
+
+
+def breadth_first_graph_search(problem, stats=None, compact=False, checkpoint=None,
+                               checkpoint_every=10000, explored=None, early=False):
+    """Експандирај го прво најплиткиот јазол во пребарувачкиот граф.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param compact: дали јазлите да се чуваат во NodeStore
+    :type compact: bool
+    :param checkpoint: директориум во кој периодично се зачувува
+                       пребарувањето (види checkpoint.resume); јазлите
+                       тогаш секогаш се чуваат во NodeStore, па compact
+                       нема ефект, а explored и early не се поддржани
+    :type checkpoint: str
+    :param checkpoint_every: на колку експандирани јазли се зачувува
+    :type checkpoint_every: int
+    :param explored: празно множество за истражените состојби
+    :type explored: set or BitStateSet
+    :param early: дупликатите и целта се проверуваат при генерирање
+                  (види graph_search); има предност пред compact
+    :type early: bool
+    :return: Node or None
+    :rtype: Node
+    """
+    if checkpoint is not None:
+        if explored is not None or early:
+            raise ValueError('checkpoint не може да се комбинира со explored или early')
+        return checkpointed_breadth_first_search(problem, checkpoint, checkpoint_every, stats)
+    if early:
+        return graph_search(problem, FIFOQueue(membership=False), stats, explored, early=True)
+    if compact:
+        return compact_graph_search(problem, FIFOQueue(membership=False), stats, explored)
+    return graph_search(problem, FIFOQueue(), stats, explored)
+
+
+def depth_first_graph_search(problem, stats=None, compact=False, explored=None, early=False):
+    """Експандирај го прво најдлабокиот јазол во пребарувачкиот граф.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :param compact: дали јазлите да се чуваат во NodeStore
+    :type compact: bool
+    :param explored: празно множество за истражените состојби
+    :type explored: set or BitStateSet
+    :param early: дупликатите и целта се проверуваат при генерирање
+                  (види graph_search); има предност пред compact
+    :type early: bool
+    :return: Node or None
+    :rtype: Node
+    """
+    if early:
+        return graph_search(problem, Stack(membership=False), stats, explored, early=True)
+    if compact:
+        return compact_graph_search(problem, Stack(membership=False), stats, explored)
+    return graph_search(problem, Stack(), stats, explored)
+
+
+def depth_limited_search(problem, limit=50, max_table_size=0, stats=None):
+    """Експандирај го прво најдлабокиот јазол во пребарувачкиот граф
+    со ограничена длабочина. Наместо рекурзија се користи експлицитен
+    стек од итератори над децата, а состојбите што веќе се на тековниот
+    пат не се посетуваат повторно (проверка за циклуси). Ако max_table_size
+    е поголем од 0, се чува и табела со најмалата длабочина на која е
+    видена секоја состојба (најмногу max_table_size состојби), па состојба
+    видена на длабочина <= d не се експандира повторно на длабочина d.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param limit: лимит за длабочината
+    :type limit: int
+    :param max_table_size: максимален број на состојби во табелата
+    :type max_table_size: int
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node, 'cutoff' or None
+    :rtype: Node
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    result = _depth_limited_search(problem, limit, max_table_size, stats)
+    return result if stats is None else stats.done(result)
+
+
+def _depth_limited_search(problem, limit, max_table_size, stats):
+    """Помошна функција за depth limited"""
+    root = Node(problem.initial)
+    if problem.goal_test(root.state):
+        return root
+    if root.depth == limit:
+        return 'cutoff'
+    encode = problem.encode
+    cutoff_occurred = False
+    seen = {}
+    path = {encode(root.state)}
+    successors = root.expand(problem)
+    if stats is not None:
+        stats.expanded(len(successors), 1)
+    stack = [(root, iter(successors))]
+    while stack:
+        node, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            path.discard(encode(node.state))
+            continue
+        key = encode(child.state)
+        if key in path:
+            if stats is not None:
+                stats.duplicates_pruned += 1
+            continue
+        if problem.goal_test(child.state):
+            return child
+        if child.depth == limit:
+            cutoff_occurred = True
+            continue
+        if max_table_size:
+            depth = seen.get(key)
+            if depth is not None and depth <= child.depth:
+                if stats is not None:
+                    stats.duplicates_pruned += 1
+                continue
+            if depth is not None or len(seen) < max_table_size:
+                seen[key] = child.depth
+        path.add(key)
+        successors = child.expand(problem)
+        stack.append((child, iter(successors)))
+        if stats is not None:
+            stats.expanded(len(successors), len(stack))
+    if cutoff_occurred:
+        return 'cutoff'
+    return None
+
+
+def iterative_deepening_search(problem, max_table_size=0, stats=None):
+    """Експандирај го прво најдлабокиот јазол во пребарувачкиот граф
+    со ограничена длабочина, со итеративно зголемување на длабочината.
+    Ако е даден stats, во stats.iterations се запишува бројот на
+    експандирани и генерирани јазли во секоја итерација.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param max_table_size: максимален број на состојби во табелата на
+                           depth_limited_search (0 значи без табела)
+    :type max_table_size: int
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node or None
+    :rtype: Node
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    for depth in range(sys.maxsize):
+        if stats is not None:
+            expanded, generated = stats.nodes_expanded, stats.nodes_generated
+        result = _depth_limited_search(problem, depth, max_table_size, stats)
+        if stats is not None:
+            stats.iterations.append({'limit': depth,
+                                     'nodes_expanded': stats.nodes_expanded - expanded,
+                                     'nodes_generated': stats.nodes_generated - generated})
+        if result != 'cutoff':
+            return result if stats is None else stats.done(result)
+
+
+def uniform_cost_search(problem, stats=None):
+    """Експандирај го прво јазолот со најниска цена во пребарувачкиот граф.
+    :param problem: даден проблем
+    :type problem: Problem
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node or None
+    :rtype: Node
+    """
+    return graph_search(problem, PriorityQueue(min, lambda a: a.path_cost), stats)
+
+
+"""
+Двонасочно пребарување во ширина
+Се пребарува истовремено нанапред од почетната состојба и наназад од
+целната состојба (problem.goal), сè додека двете граници не се сретнат
+"""
+
+
+def bidirectional_breadth_first_search(problem, stats=None):
+    """Експандирај ги наизменично нивоата од пребарувањето нанапред (од
+    problem.initial) и наназад (од problem.goal), секогаш она што има
+    помалку јазли. Наназад се користи problem.predecessors, а ако тој не
+    е имплементиран, се претпоставува дека акциите се реверзибилни и се
+    користи problem.successor. Патот се спојува во обичен ланец од јазли,
+    така што solution() работи како кај breadth_first_graph_search.
+    :param problem: даден проблем со експлицитна цел problem.goal
+    :type problem: Problem
+    :param stats: опционален собирач на статистики
+    :type stats: SearchStats
+    :return: Node or None
+    :rtype: Node
+    """
+    if stats is not None:
+        problem = stats.track(problem)
+    root = Node(problem.initial)
+    if problem.initial == problem.goal:
+        return root if stats is None else stats.done(root)
+
+    try:
+        problem.predecessors(problem.goal)
+
+        def predecessors(state):
+            return problem.predecessors(state).items()
+    except NotImplementedError:
+        def predecessors(state):
+            return [(None, previous) for previous in problem.successor(state).values()]
+
+    encode = problem.encode
+    forward = {encode(root.state): root}
+    backward = {encode(problem.goal): None}
+    forward_layer = [root]
+    backward_layer = [problem.goal]
+    meet = None
+    # Првата средба е и најкратката: пред ова ниво границите немале
+    # заедничка состојба, па секој пат е подолг од сегашните два радиуси.
+    while forward_layer and backward_layer and meet is None:
+        if len(forward_layer) <= len(backward_layer):
+            next_layer = []
+            for node in forward_layer:
+                children = node.expand(problem)
+                if stats is not None:
+                    stats.expanded(len(children), len(next_layer) + len(backward_layer))
+                for child in children:
+                    key = encode(child.state)
+                    if key in forward:
+                        if stats is not None:
+                            stats.duplicates_pruned += 1
+                        continue
+                    forward[key] = child
+                    next_layer.append(child)
+                    if key in backward:
+                        meet = key
+                        break
+                if meet is not None:
+                    break
+            forward_layer = next_layer
+        else:
+            next_layer = []
+            for state in backward_layer:
+                parents = list(predecessors(state))
+                if stats is not None:
+                    stats.expanded(len(parents), len(forward_layer) + len(next_layer))
+                for action, previous in parents:
+                    key = encode(previous)
+                    if key in backward:
+                        if stats is not None:
+                            stats.duplicates_pruned += 1
+                        continue
+                    backward[key] = (action, encode(state))
+                    next_layer.append(previous)
+                    if key in forward:
+                        meet = key
+                        break
+                if meet is not None:
+                    break
+            backward_layer = next_layer
+
+    if meet is None:
+        return None if stats is None else stats.done(None)
+    node = forward[meet]
+    key = meet
+    while backward[key] is not None:
+        action, key = backward[key]
+        state, next_state = node.state, problem.decode(key)
+        if action is None:
+            action = next(a for a, s in problem.successor(state).items() if s == next_state)
+        node = Node(next_state, node, action,
+                    problem.path_cost(node.path_cost, state, action, next_state))
+    if stats is not None:
+        stats.explored_size = len(forward) + len(backward)
+    return node if stats is None else stats.done(node)
@@ -0,0 +1,590 @@
+import array
+import collections
+import heapq
+import itertools
+import math
+
+"""
+Дефинирање на класа за структурата на проблемот кој ќе го решаваме со пребарување.
+Класата Problem е апстрактна класа од која правиме наследување за дефинирање на основните 
+карактеристики на секој проблем што сакаме да го решиме
+"""
+
+
+class Problem:
+    def __init__(self, initial, goal=None):
+        self.initial = initial
+        self.goal = goal
+
+    def successor(self, state):
+        """За дадена состојба, врати речник од парови {акција : состојба}
+        достапни од оваа состојба. Ако има многу следбеници, употребете
+        итератор кој би ги генерирал следбениците еден по еден, наместо да
+        ги генерирате сите одеднаш.
+        :param state: дадена состојба
+        :return:  речник од парови {акција : состојба} достапни од оваа
+                  состојба
+        :rtype: dict
+        """
+        raise NotImplementedError
+
+    def predecessors(self, state):
+        """За дадена состојба, врати речник од парови {акција : состојба}
+        така што со примена на акцијата над состојбата од парот се стигнува
+        во дадената состојба. Се користи при пребарување наназад од целта.
+        Ако не е имплементиран, а акциите се реверзибилни (како кај Hanoi),
+        пребарувањето наназад го користи successor.
+        :param state: дадена состојба
+        :return: речник од парови {акција : претходна состојба}
+        :rtype: dict
+        """
+        raise NotImplementedError
+
+    def encode(self, state):
+        """Врати компактен клуч (на пр. цел број) за дадената состојба.
+        Алгоритмите за пребарување го користат клучот наместо состојбата
+        во множествата од истражени состојби и во табелите, па проблемите
+        со големи состојби можат да го препокријат за да заштедат меморија.
+        Клучот мора да е еднозначен: encode(s1) == encode(s2) ако и само ако
+        s1 == s2. Даденава имплементација ја враќа самата состојба.
+        :param state: дадена состојба
+        :return: клуч за состојбата
+        """
+        return state
+
+    def decode(self, key):
+        """Врати ја состојбата од која е добиен клучот key со encode.
+        :param key: клуч добиен со encode
+        :return: состојба
+        """
+        return key
+
+    def transitions(self, state):
+        """За дадена состојба, врати ги паровите (акција, состојба) достапни
+        од неа. Алгоритмите за пребарување го користат овој метод при
+        експандирање, па successor се повикува само еднаш по состојба,
+        наместо еднаш за actions и уште еднаш за секој result. Ако successor
+        не е имплементиран, се користат actions и result.
+        :param state: дадена состојба
+        :return: парови (акција, состојба)
+        :rtype: list or iterator
+        """
+        if type(self).successor is Problem.successor:
+            return [(action, self.result(state, action)) for action in self.actions(state)]
+        successors = self.successor(state)
+        if isinstance(successors, dict):
+            return successors.items()
+        return successors
+
+    def actions(self, state):
+        """За дадена состојба state, врати листа од сите акции што може да
+        се применат над таа состојба
+        :param state: дадена состојба
+        :return: листа на акции
+        :rtype: list
+        """
+        raise NotImplementedError
+
+    def result(self, state, action):
+        """За дадена состојба state и акција action, врати ја состојбата
+        што се добива со примена на акцијата над состојбата
+        :param state: дадена состојба
+        :param action: дадена акција
+        :return: резултантна состојба
+        """
+        raise NotImplementedError
+
+    def goal_test(self, state):
+        """Врати True ако state е целна состојба. Даденава имплементација
+        на методот директно ја споредува state со self.goal, како што е
+        специфицирана во конструкторот. Имплементирајте го овој метод ако
+        проверката со една целна состојба self.goal не е доволна.
+        :param state: дадена состојба
+        :return: дали дадената состојба е целна состојба
+        :rtype: bool
+        """
+        return state == self.goal
+
+    def path_cost(self, c, state1, action, state2):
+        """Врати ја цената на решавачкиот пат кој пристигнува во состојбата
+        state2 од состојбата state1 преку акцијата action, претпоставувајќи
+        дека цената на патот до состојбата state1 е c. Ако проблемот е таков
+        што патот не е важен, оваа функција ќе ја разгледува само состојбата
+        state2. Ако патот е важен, ќе ја разгледува цената c и можеби и
+        state1 и action. Даденава имплементација му доделува цена 1 на секој
+        чекор од патот.
+        :param c: цена на патот до состојбата state1
+        :param state1: дадена моментална состојба
+        :param action: акција која треба да се изврши
+        :param state2: состојба во која треба да се стигне
+        :return: цена на патот по извршување на акцијата
+        :rtype: float
+        """
+        return c + 1
+
+    def value(self):
+        """За проблеми на оптимизација, секоја состојба си има вредност.
+        Hill-climbing и сличните алгоритми се обидуваат да ја максимизираат
+        оваа вредност.
+        :return: вредност на состојба
+        :rtype: float
+        """
+        raise NotImplementedError
+
+
+"""
+Дефинирање на класата за структурата на јазел од пребарување.
+Класата Node не се наследува.
+Јазлите користат __slots__ за да не чуваат __dict__; f и h се
+резервирани за вредностите што ги запишува memoize.
+"""
+
+
+class Node:
+    __slots__ = ('state', 'parent', 'action', 'path_cost', 'depth', 'f', 'h')
+
+    def __init__(self, state, parent=None, action=None, path_cost=0):
+        """Креирај јазол од пребарувачкото дрво, добиен од parent со примена
+        на акцијата action
+        :param state: моментална состојба (current state)
+        :param parent: родителска состојба (parent state)
+        :param action: акција (action)
+        :param path_cost: цена на патот (path cost)
+        """
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.path_cost = path_cost
+        self.depth = 0  # search depth
+        if parent:
+            self.depth = parent.depth + 1
+
+    def __repr__(self):
+        return "<Node %s>" % (self.state,)
+
+    def __lt__(self, node):
+        return self.state < node.state
+
+    def expand(self, problem):
+        """Излистај ги јазлите достапни во еден чекор од овој јазол.
+        :param problem: даден проблем
+        :return: листа на достапни јазли во еден чекор
+        :rtype: list(Node)
+        """
+        return [Node(next_state, self, action,
+                     problem.path_cost(self.path_cost, self.state, action, next_state))
+                for action, next_state in problem.transitions(self.state)]
+
+    def child_node(self, problem, action):
+        """Дете јазел
+        :param problem: даден проблем
+        :param action: дадена акција
+        :return: достапен јазел според дадената акција
+        :rtype: Node
+        """
+        next_state = problem.result(self.state, action)
+        return Node(next_state, self, action,
+                    problem.path_cost(self.path_cost, self.state,
+                                      action, next_state))
+
+    def solution(self):
+        """Врати ја секвенцата од акции за да се стигне од коренот до овој јазол.
+        :return: секвенцата од акции
+        :rtype: list
+        """
+        return [node.action for node in self.path()[1:]]
+
+    def solve(self):
+        """Врати ја секвенцата од состојби за да се стигне од коренот до овој јазол.
+        :return: листа од состојби
+        :rtype: list
+        """
+        return [node.state for node in self.path()[0:]]
+
+    def path(self):
+        """Врати ја листата од јазли што го формираат патот од коренот до овој јазол.
+        :return: листа од јазли од патот
+        :rtype: list(Node)
+        """
+        x, result = self, []
+        while x:
+            result.append(x)
+            x = x.parent
+        result.reverse()
+        return result
+
+    """Сакаме редицата од јазли кај breadth_first_search или 
+    astar_search да не содржи состојби - дупликати, па јазлите што
+    содржат иста состојба ги третираме како исти. [Проблем: ова може
+    да не биде пожелно во други ситуации.]"""
+
+    def __eq__(self, other):
+        return isinstance(other, Node) and self.state == other.state
+
+    def __hash__(self):
+        return hash(self.state)
+
+
+class NodeStore:
+    """Компактно складиште на јазли од пребарувачкото дрво. Наместо објект
+    Node за секој јазол, се чуваат паралелни низи (array) индексирани со
+    цел број (id на јазелот): клучот на состојбата (problem.encode), id на
+    родителот, id на акцијата и цената на патот. Објекти Node се градат
+    само за патот до пронајдениот јазол, со node(node_id)."""
+
+    def __init__(self, problem):
+        """
+        :param problem: даден проблем
+        :type problem: Problem
+        """
+        self.problem = problem
+        self.keys = []
+        self.parents = array.array('q')
+        self.actions = array.array('l')
+        self.costs = array.array('d')
+        self.action_ids = {}
+        self.action_list = []
+
+    def add(self, state, parent=-1, action=None, path_cost=0, key=None):
+        """Додади нов јазол и врати го неговиот id.
+        :param state: состојба на јазелот
+        :param parent: id на родителот (-1 за коренот)
+        :type parent: int
+        :param action: акција со која се стигнува од родителот
+        :param path_cost: цена на патот до јазелот
+        :param key: веќе пресметан problem.encode(state), ако постои
+        :return: id на новиот јазол
+        :rtype: int
+        """
+        action_id = self.action_ids.get(action)
+        if action_id is None:
+            action_id = self.action_ids[action] = len(self.action_list)
+            self.action_list.append(action)
+        self.keys.append(self.problem.encode(state) if key is None else key)
+        self.parents.append(parent)
+        self.actions.append(action_id)
+        self.costs.append(path_cost)
+        return len(self.keys) - 1
+
+    def state(self, node_id):
+        return self.problem.decode(self.keys[node_id])
+
+    def path_ids(self, node_id):
+        """Врати ја листата од id на јазлите од коренот до node_id.
+        :param node_id: id на јазелот
+        :type node_id: int
+        :return: листа од id
+        :rtype: list(int)
+        """
+        result = []
+        while node_id != -1:
+            result.append(node_id)
+            node_id = self.parents[node_id]
+        result.reverse()
+        return result
+
+    def solution(self, node_id):
+        """Врати ја секвенцата од акции од коренот до node_id.
+        :param node_id: id на јазелот
+        :type node_id: int
+        :return: секвенцата од акции
+        :rtype: list
+        """
+        return [self.action_list[self.actions[i]] for i in self.path_ids(node_id)[1:]]
+
+    def node(self, node_id):
+        """Изгради ланец од објекти Node од коренот до node_id, така што
+        solution(), solve() и path() работат како кај обичното пребарување.
+        Цените се пресметуваат повторно со problem.path_cost.
+        :param node_id: id на јазелот
+        :type node_id: int
+        :return: јазол
+        :rtype: Node
+        """
+        node = None
+        for i in self.path_ids(node_id):
+            state = self.state(i)
+            if node is None:
+                node = Node(state)
+            else:
+                action = self.action_list[self.actions[i]]
+                node = Node(state, node, action,
+                            self.problem.path_cost(node.path_cost, node.state, action, state))
+        return node
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class BitStateSet:
+    """Приближно множество од истражени состојби (bitstate hashing,
+    Bloom филтер). Секој клуч поставува k бита во низа од size_mb мегабајти,
+    па множеството зафаќа константна меморија без оглед на бројот на
+    состојби. Може да врати лажно позитивен одговор (состојба што не е
+    истражена се смета за истражена и се прескокнува), но никогаш лажно
+    негативен. Се користи наместо set() во graph_search и
+    best_first_graph_search преку параметарот explored."""
+
+    def __init__(self, size_mb=64, hashes=3):
+        """
+        :param size_mb: големина на битовата низа во мегабајти
+        :type size_mb: float
+        :param hashes: број на хеш функции k
+        :type hashes: int
+        """
+        self.bits = max(8, int(size_mb * 8 * 1024 * 1024))
+        self.hashes = hashes
+        self.data = bytearray((self.bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # двојно хеширање: i-тата позиција е h1 + i * h2 (mod m)
+        h = (hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, key):
+        """Додади го клучот key во множеството.
+        :param key: клуч од problem.encode
+        :return: None
+        """
+        data = self.data
+        new = False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not data[position >> 3] & mask:
+                data[position >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+
+    def __contains__(self, key):
+        data = self.data
+        return all(data[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def false_positive_rate(self):
+        """Проценета веројатност дека нова состојба ќе се смета за веќе
+        истражена, (1 - e^(-kn/m))^k, каде n е бројот на додадени клучеви.
+        :return: веројатност помеѓу 0 и 1
+        :rtype: float
+        """
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+
+"""
+Дефинирање на помошни структури за чување на листата на генерирани, но непроверени јазли
+"""
+
+
+class Queue:
+    """Queue е апстрактна класа / интерфејс. Постојат 3 типа:
+        Stack(): Last In First Out Queue (стек).
+        FIFOQueue(): First In First Out Queue (редица).
+        PriorityQueue(order, f): Queue во сортиран редослед (подразбирливо,од најмалиот кон
+                                 најголемиот јазол).
+    """
+
+    def __init__(self):
+        raise NotImplementedError
+
+    def append(self, item):
+        """Додади го елементот item во редицата
+        :param item: даден елемент
+        :return: None
+        """
+        raise NotImplementedError
+
+    def extend(self, items):
+        """Додади ги елементите items во редицата
+        :param items: дадени елементи
+        :return: None
+        """
+        raise NotImplementedError
+
+    def pop(self):
+        """Врати го првиот елемент од редицата
+        :return: прв елемент
+        """
+        raise NotImplementedError
+
+    def __len__(self):
+        """Врати го бројот на елементи во редицата
+        :return: број на елементи во редицата
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    def __contains__(self, item):
+        """Проверка дали редицата го содржи елементот item
+        :param item: даден елемент
+        :return: дали queue го содржи item
+        :rtype: bool
+        """
+        raise NotImplementedError
+
+
+class _DequeQueue(Queue):
+    """Заедничка основа за Stack и FIFOQueue, кои се разликуваат само по
+    крајот од кој pop го вади елементот (метод _take).
+    Елементите се чуваат во deque, а речникот counts брои колку пати
+    секој елемент (т.е. состојба на јазел) се наоѓа во редицата, па
+    проверката за припадност е O(1). Ако membership е False, counts не
+    се чува (на пр. кога елементите се id на јазли кои никогаш не се
+    проверуваат), а проверката за припадност е линеарна."""
+
+    def __init__(self, membership=True):
+        self.data = collections.deque()
+        self.counts = {} if membership else None
+
+    def _take(self):
+        """Извади го следниот елемент од deque-от."""
+        raise NotImplementedError
+
+    def append(self, item):
+        self.data.append(item)
+        if self.counts is not None:
+            self.counts[item] = self.counts.get(item, 0) + 1
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def pop(self):
+        item = self._take()
+        if self.counts is None:
+            return item
+        count = self.counts[item] - 1
+        if count:
+            self.counts[item] = count
+        else:
+            del self.counts[item]
+        return item
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, item):
+        if self.counts is None:
+            return item in self.data
+        return item in self.counts
+
+
+class Stack(_DequeQueue):
+    """Last-In-First-Out Queue (види _DequeQueue)."""
+
+    def _take(self):
+        return self.data.pop()
+
+
+class FIFOQueue(_DequeQueue):
+    """First-In-First-Out Queue (види _DequeQueue)."""
+
+    def _take(self):
+        return self.data.popleft()
+
+
+class PriorityQueue(Queue):
+    """Редица во која прво се враќа минималниот (или максималниот) елемент
+    (како што е определено со f и order). Оваа структура се користи кај
+    информирано пребарување.
+    Елементите се чуваат во бинарен куп (heapq), а речникот index ги
+    пресликува елементите (јазлите, т.е. нивните состојби) во нивниот запис
+    во купот, па проверката за припадност, пристапот и бришењето се O(1),
+    а додавањето и вадењето O(log n). Избришаните записи само се означуваат
+    како неважечки и се отстрануваат при pop (lazy deletion). Кога
+    неважечките записи ќе станат повеќе од важечките, купот се гради
+    одново, па неговата големина останува O(len(редица))."""
+
+    def __init__(self, order=min, f=lambda x: x, key=None):
+        """
+        :param order: функција за подредување, ако order е min, се враќа елементот
+                      со минимална f(x); ако order е max, тогаш се враќа елементот
+                      со максимална f(x).
+        :param f: функција f(x)
+        :param key: функција што го дава клучот во index за даден елемент;
+                    ако е None, клуч е самиот елемент
+        """
+        assert order in [min, max]
+        self.data = []
+        self.index = {}
+        self.counter = itertools.count()
+        self.order = order
+        self.f = f
+        self.key = key or (lambda x: x)
+
+    def _value(self, item):
+        value = self.f(item)
+        return value if self.order == min else -value
+
+    def append(self, item):
+        """Додади го елементот item во редицата. Ако еднаков елемент веќе
+        постои, се задржува оној со подобра вредност (decrease-key).
+        :param item: даден елемент
+        :return: None
+        """
+        value = self._value(item)
+        key = self.key(item)
+        entry = self.index.get(key)
+        if entry is not None:
+            if not value < entry[0]:
+                return
+            entry[-1] = False
+        entry = [value, item, next(self.counter), True]
+        self.index[key] = entry
+        heapq.heappush(self.data, entry)
+        self._compact()
+
+    def _compact(self):
+        # неважечките записи се бришат кога ќе ги надминат важечките
+        if len(self.data) > 2 * len(self.index) + 64:
+            self.data = [entry for entry in self.data if entry[-1]]
+            heapq.heapify(self.data)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def pop(self):
+        while self.data:
+            entry = heapq.heappop(self.data)
+            if entry[-1]:
+                del self.index[self.key(entry[1])]
+                return entry[1]
+        raise IndexError('pop from an empty priority queue')
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, item):
+        return self.key(item) in self.index
+
+    def __getitem__(self, key):
+        entry = self.index.get(self.key(key))
+        if entry is not None:
+            return entry[1]
+
+    def __delitem__(self, key):
+        entry = self.index.pop(self.key(key), None)
+        if entry is not None:
+            entry[-1] = False
+            self._compact()
+
+
+def run_steps(steps):
+    """Изврши го пребарувањето steps до крај и врати го неговиот резултат.
+    Основните алгоритми се напишани како генератори кои застануваат по
+    секое експандирање; синхроните функции ги извршуваат со run_steps, а
+    асинхроните (async_search) ја враќаат контролата помеѓу чекорите.
+    :param steps: генератор чија вредност при StopIteration е резултатот
+    :type steps: generator
+    :return: резултатот на пребарувањето
+    """
+    try:
+        while True:
+            next(steps)
+    except StopIteration as stop:
+        return stop.value
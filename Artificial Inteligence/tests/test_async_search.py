@@ -0,0 +1,62 @@
+import asyncio
+import os
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'Uninformed Search'))
+
+from searching_framework import FIFOQueue, PriorityQueue, SearchProgress, SearchStats, async_graph_search, \
+    async_best_first_graph_search, breadth_first_graph_search, uniform_cost_search
+from TowerDisks import Hanoi
+
+
+def hanoi(disks):
+    return Hanoi((tuple(range(disks, 0, -1)), (), ()), ((), (), tuple(range(disks, 0, -1))))
+
+
+class AsyncSearchTest(unittest.TestCase):
+
+    def test_same_result_as_synchronous_search(self):
+        problem = hanoi(6)
+
+        async def run():
+            progress = SearchProgress()
+            task = asyncio.ensure_future(async_graph_search(problem, FIFOQueue(), SearchStats(),
+                                                            progress=progress, every=100))
+            events = [event async for event in progress]
+            return (await task), events
+
+        (node, stats), events = asyncio.run(run())
+        expected, expected_stats = breadth_first_graph_search(problem, stats=SearchStats())
+        self.assertEqual(node.solution(), expected.solution())
+        self.assertEqual(stats.nodes_expanded, expected_stats.nodes_expanded)
+        self.assertTrue(events)
+        self.assertEqual(events[0]['nodes_expanded'], 100)
+
+        compact = asyncio.run(async_graph_search(problem, FIFOQueue(membership=False), compact=True))
+        self.assertEqual(compact.solution(), expected.solution())
+        best = asyncio.run(async_best_first_graph_search(problem, lambda n: n.path_cost))
+        self.assertEqual(best.path_cost, uniform_cost_search(problem).path_cost)
+
+    def test_cancellation_ends_progress(self):
+        async def run():
+            progress = SearchProgress()
+            task = asyncio.ensure_future(async_graph_search(hanoi(12), FIFOQueue(), progress=progress,
+                                                            every=10))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return [event async for event in progress]
+
+        self.assertIsInstance(asyncio.run(run()), list)
+
+    def test_early_rejects_priority_queue(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(async_graph_search(hanoi(3), PriorityQueue(min, lambda n: n.path_cost), early=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
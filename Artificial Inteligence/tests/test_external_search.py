@@ -0,0 +1,52 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'Uninformed Search'))
+
+from searching_framework import SearchStats, breadth_first_graph_search, external_breadth_first_search
+from searching_framework import external_search
+from TowerDisks import Hanoi
+
+"""
+Тестови за пребарувањето во ширина со надворешна меморија
+Бројот на прочитани клучеви од диск треба да расте линеарно со бројот на
+состојби, а не со бројот на нивоа пати бројот на состојби.
+"""
+
+
+def hanoi(disks):
+    return Hanoi((tuple(range(disks, 0, -1)), (), ()), ((), (), tuple(range(disks, 0, -1))))
+
+
+class ExternalSearchTest(unittest.TestCase):
+
+    def test_same_depth_as_breadth_first_search(self):
+        problem = hanoi(5)
+        expected = breadth_first_graph_search(problem)
+        for reversible in (False, True):
+            with self.subTest(reversible=reversible):
+                node = external_breadth_first_search(problem, run_size=50, fan_in=3, reversible=reversible)
+                self.assertEqual(len(node.solution()), len(expected.solution()))
+                state = problem.initial
+                for action in node.solution():
+                    state = dict(problem.transitions(state))[action]
+                self.assertEqual(state, problem.goal)
+
+    def test_reads_grow_linearly_with_states(self):
+        for reversible in (False, True):
+            for disks in (6, 8):
+                with self.subTest(reversible=reversible, disks=disks):
+                    with mock.patch.object(external_search, '_key_at', wraps=external_search._key_at) as reads:
+                        node, stats = external_breadth_first_search(hanoi(disks), reversible=reversible,
+                                                                    stats=SearchStats())
+                    self.assertEqual(len(node.solution()), 2 ** disks - 1)
+                    self.assertEqual(stats.explored_size, 3 ** disks)
+                    self.assertLess(reads.call_count, 60 * stats.explored_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import sys
+import tracemalloc
+import unittest
+from unittest import mock
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'Uninformed Search'))
+sys.path.append(os.path.join(ROOT, 'InformedSearch'))
+
+from searching_framework import PriorityQueue, SearchStats, astar_search, breadth_first_graph_search, \
+    simplified_memory_bounded_astar_search
+from searching_framework import informed_search
+from TowerDisks import Hanoi
+import SnakeInformed
+
+"""
+Тестови дека алгоритмите со ограничена меморија навистина ја ограничуваат
+Купот на PriorityQueue брише мрзливо (lazy deletion), па се проверува дека
+неважечките записи не го прават купот поголем од O(големина на редицата).
+Компактното пребарување (NodeStore) треба да троши помалку меморија од
+обичното, а не повеќе.
+"""
+
+
+class RecordingQueue(PriorityQueue):
+    """PriorityQueue која ја памети најголемата големина на купот."""
+    largest = 0
+
+    def pop(self):
+        RecordingQueue.largest = max(RecordingQueue.largest, len(self.data))
+        return super().pop()
+
+
+class PriorityQueueHeapTest(unittest.TestCase):
+
+    def test_deleted_entries_do_not_accumulate(self):
+        queue = PriorityQueue(min, lambda x: x[1], lambda x: x[0])
+        for i in range(100):
+            queue.append((i, i))
+        for step in range(100000):
+            item = (step % 100, step)
+            del queue[item]
+            queue.append(item)
+        self.assertEqual(len(queue), 100)
+        self.assertLessEqual(len(queue.data), 2 * len(queue) + 65)
+
+
+class SMAStarMemoryTest(unittest.TestCase):
+
+    def test_heaps_stay_proportional_to_max_nodes(self):
+        problem = SnakeInformed.Snake(((0, 7), ((0, 8), (0, 9)), ((3, 4), (5, 6)), 'jug'))
+        max_nodes = 30
+        RecordingQueue.largest = 0
+        with mock.patch.object(informed_search, 'PriorityQueue', RecordingQueue):
+            node, stats = simplified_memory_bounded_astar_search(problem, max_nodes=max_nodes, stats=SearchStats())
+        self.assertEqual(node.path_cost, astar_search(problem).path_cost)
+        self.assertGreater(stats.nodes_forgotten, 0)
+        self.assertLessEqual(RecordingQueue.largest, 2 * max_nodes + 65)
+
+
+class CompactSearchMemoryTest(unittest.TestCase):
+
+    @staticmethod
+    def peak(problem, compact):
+        tracemalloc.start()
+        try:
+            node = breadth_first_graph_search(problem, compact=compact)
+            return node, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_compact_uses_less_memory_than_plain(self):
+        problem = Hanoi((tuple(range(8, 0, -1)), (), ()), ((), (), tuple(range(8, 0, -1))))
+        plain, plain_peak = self.peak(problem, False)
+        compact, compact_peak = self.peak(problem, True)
+        self.assertEqual(compact.solution(), plain.solution())
+        self.assertLess(compact_peak, plain_peak)
+
+
+if __name__ == '__main__':
+    unittest.main()
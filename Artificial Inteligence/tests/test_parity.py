@@ -0,0 +1,99 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'Uninformed Search'))
+sys.path.append(os.path.join(ROOT, 'InformedSearch'))
+
+import searching_framework
+from TowerDisks import Hanoi
+from Solitaire import Solitaire
+import SnakeInformed
+import SnakeUninformed
+import SoccerUninformed
+
+"""
+Тестови за еднаквост (parity) со оригиналните скрипти
+Очекуваните решенија во parity_expected.json се запишани со скриптите од
+почетната (baseline) верзија на репозиториумот, во која секоја скрипта
+имаше своја копија од рамката за пребарување. Се проверува дека скриптите
+го печатат истото како порано и дека секој алгоритам од searching_framework
+го враќа истото решение како оригиналниот алгоритам над истата инстанца.
+"""
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parity_expected.json'),
+          encoding='utf-8') as f:
+    EXPECTED = json.load(f)
+
+
+# хевристики за проблемите кои немаат h; истите се користени и при запишувањето
+
+class HanoiH(Hanoi):
+    def h(self, node):
+        return sum(1 for i, tower in enumerate(node.state) for disk in tower if disk not in self.goal[i])
+
+
+class SolitaireH(Solitaire):
+    def h(self, node):
+        return len(node.state) - 1
+
+
+class SnakeRedH(SnakeUninformed.Snake):
+    def h(self, node):
+        return len(node.state[2])
+
+
+class FootballH(SoccerUninformed.Football):
+    def h(self, node):
+        x, y = node.state[1]
+        return abs(7 - x) + max(0, 2 - y, y - 3)
+
+
+START = (0, 7), ((0, 8), (0, 9))
+OPONENTS = SoccerUninformed.generate_oponents([(3, 3), (5, 4)])
+GOALS = [(7, 2), (7, 3)]
+
+INSTANCES = {
+    'hanoi-3': lambda: HanoiH(((3, 2, 1), (), ()), ((), (), (3, 2, 1))),
+    'hanoi-2-middle': lambda: HanoiH(((2, 1), (), ()), ((), (2, 1), ())),
+    'solitaire-5-easy': lambda: SolitaireH(((0, 2), (1, 3)), 5, ()),
+    'solitaire-5-obstacle': lambda: SolitaireH(((2, 0), (1, 1), (1, 2), (1, 3), (1, 4)), 5,
+                                               ((4, 1), (4, 2), (4, 3), (4, 4))),
+    'snake-1': lambda: SnakeInformed.Snake(START + (((0, 3),), 'jug')),
+    'snake-2': lambda: SnakeInformed.Snake(START + (((3, 4), (5, 6)), 'jug')),
+    'snake-red-1': lambda: SnakeRedH(START + (((0, 3),), 'jug'), ((0, 5),)),
+    'snake-red-2': lambda: SnakeRedH(START + (((3, 4), (2, 6)), 'jug'), ((2, 2),)),
+    'football-1': lambda: FootballH(((4, 2), (5, 2)), OPONENTS, GOALS),
+    'football-2': lambda: FootballH(((5, 1), (6, 2)), OPONENTS, GOALS),
+    'football-3': lambda: FootballH(((2, 2), (3, 1)), OPONENTS, GOALS),
+}
+
+
+class ScriptParityTest(unittest.TestCase):
+
+    def test_scripts_print_the_same_output(self):
+        for case in EXPECTED['scripts']:
+            with self.subTest(script=case['script'], input=case['input']):
+                result = subprocess.run([sys.executable, os.path.join(ROOT, case['script'])], input=case['input'],
+                                        capture_output=True, text=True, timeout=120)
+                self.assertEqual(result.returncode, 0, result.stderr)
+                self.assertEqual(result.stdout, case['output'])
+
+
+class AlgorithmParityTest(unittest.TestCase):
+
+    def test_algorithms_return_the_same_solutions(self):
+        self.assertEqual(sorted(EXPECTED['algorithms']), sorted(INSTANCES))
+        for instance, solutions in EXPECTED['algorithms'].items():
+            for algorithm, expected in solutions.items():
+                with self.subTest(instance=instance, algorithm=algorithm):
+                    node = getattr(searching_framework, algorithm)(INSTANCES[instance]())
+                    self.assertEqual(node.solution() if node is not None else None, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import signal
+import sys
+import time
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'Uninformed Search'))
+
+from searching_framework import portfolio_search
+from TowerDisks import Hanoi
+
+
+class SelfKillingHanoi(Hanoi):
+    """Hanoi чиј successor го убива процесот без да прати порака."""
+
+    def successor(self, state):
+        os.kill(os.getpid(), signal.SIGKILL)
+
+
+class PortfolioTest(unittest.TestCase):
+
+    def test_returns_a_solution(self):
+        problem = Hanoi(((3, 2, 1), (), ()), ((), (), (3, 2, 1)))
+        node, winner, report = portfolio_search(problem, optimal=True)
+        self.assertEqual(len(node.solution()), 7)
+        self.assertEqual(report[winner]['status'], 'done')
+
+    @unittest.skipUnless(hasattr(signal, 'SIGKILL'), 'SIGKILL is not available')
+    def test_killed_workers_are_reported_as_crashed(self):
+        problem = SelfKillingHanoi(((3, 2, 1), (), ()), ((), (), (3, 2, 1)))
+        start = time.monotonic()
+        node, winner, report = portfolio_search(problem)
+        self.assertLess(time.monotonic() - start, 30)
+        self.assertIsNone(node)
+        self.assertIsNone(winner)
+        for name, record in report.items():
+            self.assertEqual(record['status'], 'crashed', name)
+            self.assertEqual(record['exitcode'], -signal.SIGKILL, name)
+
+
+if __name__ == '__main__':
+    unittest.main()